@@ -3,12 +3,10 @@ import logging
 from flask import Flask, jsonify
 
 from app.config.settings import Config, get_config
-from app.infrastructure.redis_client import RedisClientFactory
-from app.infrastructure.di.service_container import ServiceContainer
-from app.middleware.rate_limiter import create_rate_limiter
-from app.middleware.monitoring import register_metrics_middleware
-from app.middleware.error_handler import init_error_handlers
-from app.api import webhook_blueprint, messages_blueprint, health_blueprint, chat_blueprint
+
+
+# Root logging handlers are installed once per process, not once per app
+_LOGGING_CONFIGURED = False
 
 
 def create_app(config_class=None) -> Flask:
@@ -28,24 +26,27 @@ def create_app(config_class=None) -> Flask:
     try:
         app = Flask(__name__)
         
+        # Decode request bodies with orjson (falls back to stdlib json)
+        from app.utils.fastjson import FastJSONProvider
+        app.json = FastJSONProvider(app)
+        
         # Load configuration
+        # Config reads the environment (including .env) once at import time, so
+        # APP_SECRET / APP_ID are populated here along with everything else
         config = config_class or get_config()
         app.config.from_object(config)
-        
-        # Also load environment variables directly to app.config for backward compatibility
-        # This ensures variables like APP_SECRET are available via current_app.config
-        import os
-        from dotenv import load_dotenv
-        load_dotenv()
-        app.config["APP_SECRET"] = os.getenv("APP_SECRET")
-        app.config["APP_ID"] = os.getenv("APP_ID")
-        
+
         # Configure logging FIRST (needed for all subsequent operations)
         _configure_logging()
         
         # Register blueprints IMMEDIATELY so routes are available right away
         # This allows Railway's health checks to pass even during initialization
+        from app.api import (
+            webhook_blueprint, webhook_verify_blueprint, messages_blueprint,
+            health_blueprint, chat_blueprint
+        )
         app.register_blueprint(webhook_blueprint)
+        app.register_blueprint(webhook_verify_blueprint)
         app.register_blueprint(messages_blueprint)
         app.register_blueprint(health_blueprint)
         app.register_blueprint(chat_blueprint)
@@ -54,7 +55,7 @@ def create_app(config_class=None) -> Flask:
         @app.route("/", methods=["GET"])
         def root():
             """Root endpoint for testing."""
-            _logger.info("Root endpoint called")
+            _logger.debug("Root endpoint called")
             return jsonify({
                 "status": "ok",
                 "service": "message-bot",
@@ -97,16 +98,10 @@ def create_app(config_class=None) -> Flask:
             # But don't raise here, let it fail gracefully on first request
             _logger.warning("App will attempt to initialize services on first request")
         
-        # Register teardown handlers
-        @app.teardown_appcontext
-        def close_redis(error):
-            """Close Redis connections on app teardown."""
-            # Redis connection pool handles cleanup automatically
-            pass
-        
         _logger.info("Flask application initialized successfully")
-        _logger.info(f"Application ready - registered blueprints: {[bp.name for bp in app.blueprints.values()]}")
-        _logger.info(f"App routes registered: {[str(rule) for rule in app.url_map.iter_rules()]}")
+        if _logger.isEnabledFor(logging.DEBUG):
+            _logger.debug("Registered blueprints: %s", list(app.blueprints))
+            _logger.debug("Routes: %s", [rule.rule for rule in app.url_map.iter_rules()])
         
     except Exception as e:
         _logger.critical(f"Failed to create Flask application: {e}", exc_info=True)
@@ -167,20 +162,28 @@ def _initialize_authentication(app: Flask) -> None:
 
 
 def _configure_logging() -> None:
-    """Configure application logging."""
+    """Configure application logging (once per process)."""
     import sys
     
-    # Configure logging to send everything to stdout (Railway marks stderr as errors)
+    global _LOGGING_CONFIGURED
+    if _LOGGING_CONFIGURED:
+        return
+    _LOGGING_CONFIGURED = True
+    
+    # Normal logs go to stdout and warnings/errors to stderr, so the platform can
+    # tell them apart without redirecting sys.stderr process-wide
+    stdout_handler = logging.StreamHandler(sys.stdout)
+    stdout_handler.addFilter(lambda record: record.levelno < logging.WARNING)
+    
+    stderr_handler = logging.StreamHandler(sys.stderr)
+    stderr_handler.setLevel(logging.WARNING)
+    
     logging.basicConfig(
         level=logging.INFO if not Config.DEBUG else logging.DEBUG,
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        stream=sys.stdout,  # Explicitly send to stdout
-        force=True  # Override any existing configuration
+        handlers=[stdout_handler, stderr_handler],
+        force=True  # Override configuration installed by imported modules (first call only)
     )
-    
-    # Also redirect stderr to stdout for any libraries that write to stderr
-    # This prevents Railway from marking normal logs as errors
-    sys.stderr = sys.stdout
 
 
 def _initialize_infrastructure(app: Flask) -> None:
@@ -190,6 +193,8 @@ def _initialize_infrastructure(app: Flask) -> None:
     Args:
         app: Flask application instance
     """
+    from app.infrastructure.redis_client import RedisClientFactory
+    
     try:
         # Try to initialize Redis connection pool (optional)
         redis_client = RedisClientFactory.get_client()
@@ -209,12 +214,17 @@ def _initialize_middleware(app: Flask) -> None:
     Args:
         app: Flask application instance
     """
-    # Rate limiting
-    limiter = create_rate_limiter(app)
-    app.config['limiter'] = limiter
+    # Middleware modules are imported here (not at module level) so that
+    # disabled features are never loaded
+    from app.middleware.rate_limiter import create_rate_limiter
+    from app.middleware.error_handler import init_error_handlers
+    
+    # Rate limiting (Flask-Limiter registers itself in app.extensions)
+    create_rate_limiter(app)
     
     # Monitoring (Prometheus metrics)
     if Config.ENABLE_METRICS:
+        from app.middleware.monitoring import register_metrics_middleware
         register_metrics_middleware(app)
     
     # Error handling (Sentry)
@@ -228,14 +238,20 @@ def _initialize_services(app: Flask) -> None:
     Args:
         app: Flask application instance
     """
-    container = ServiceContainer()
+    from app.infrastructure.di.service_container import get_service_container
+    
+    container = get_service_container()
     
-    # Store container in app config for access in views/tasks
-    app.config['service_container'] = container
+    # Store container in app extensions for access in views/tasks
+    app.extensions['service_container'] = container
     
-    # Pre-initialize services (optional, for eager loading)
-    # This can be done lazily instead
-    logging.debug("Services will be initialized on demand via ServiceContainer")
+    # Bind the request-path services once so views don't resolve them per request.
+    # If a provider can't be built yet, views fall back to resolving it lazily.
+    try:
+        app.extensions['message_provider'] = container.get_message_provider()
+        app.extensions['message_handler'] = container.get_message_handler()
+    except Exception as e:
+        logging.warning(f"Message services not pre-bound, will resolve on first request: {e}")
     
     # Initialize Starlings API authentication
     _initialize_authentication(app)
\ No newline at end of file
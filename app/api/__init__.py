@@ -5,12 +5,14 @@ Following event-driven architecture principles.
 """
 
 from app.api.webhook import webhook_blueprint
+from app.api.webhook_verify import webhook_verify_blueprint
 from app.api.messages import messages_blueprint
 from app.api.health import health_blueprint
 from app.api.chat import chat_blueprint
 
 __all__ = [
     "webhook_blueprint",
+    "webhook_verify_blueprint",
     "messages_blueprint",
     "health_blueprint",
     "chat_blueprint",
@@ -1,40 +1,55 @@
 """Chat API endpoints for frontend/UI consumption."""
 import logging
-from typing import Dict, Any, Tuple
-from flask import Blueprint, request, jsonify, current_app
+from typing import Dict, Any, Optional, Tuple, TYPE_CHECKING
+from flask import Blueprint, request, current_app
 
 from app.application.services.conversation_service import (
     ConversationService,
     ConversationRequest,
     ConversationResponse
 )
+from app.utils import fastjson
+from app.utils.fastjson import json_response, ojsonify
+
+if TYPE_CHECKING:
+    from app.infrastructure.di.service_container import ServiceContainer
 
 
 chat_blueprint = Blueprint("chat", __name__)
 _logger = logging.getLogger(__name__)
 
+# Constant error bodies, serialized once at import time
+_ERR_BODY_REQUIRED = fastjson.dumps({"success": False, "error": "Request body required"})
+_ERR_INVALID_JSON = fastjson.dumps({"success": False, "error": "Invalid JSON"})
+_ERR_MISSING_USER_ID = fastjson.dumps({"success": False, "error": "Missing required field: user_id"})
+_ERR_MISSING_MESSAGE = fastjson.dumps({"success": False, "error": "Missing required field: message"})
+_ERR_SERVICE_UNAVAILABLE = fastjson.dumps({"success": False, "error": "Service temporarily unavailable"})
+
 
 def _get_conversation_service() -> ConversationService:
     """
     Get conversation service from service container.
     
+    The service is resolved once per app and cached in ``app.extensions``.
+    
     Returns:
         ConversationService instance
         
     Raises:
         RuntimeError: If service container is not available
     """
-    container = current_app.config.get('service_container')
-    if not container:
+    service = current_app.extensions.get('conversation_service')
+    if service is not None:
+        return service
+    
+    container: Optional["ServiceContainer"] = current_app.extensions.get('service_container')
+    if container is None:
         raise RuntimeError("Service container not available")
     
-    # Get conversation service (will be added to container)
-    if hasattr(container, 'get_conversation_service'):
-        return container.get_conversation_service()
-    else:
-        # Fallback: create service directly
-        ai_provider = container.get_ai_provider()
-        return ConversationService(ai_provider=ai_provider)
+    # ServiceContainer memoizes the service, so this is only built once
+    service = container.get_conversation_service()
+    current_app.extensions['conversation_service'] = service
+    return service
 
 
 @chat_blueprint.route("/api/chat", methods=["POST"])
@@ -62,29 +77,24 @@ def chat():
         }
     """
     try:
-        body = request.get_json()
+        # silent=True returns None for malformed JSON instead of raising
+        body = request.get_json(silent=True)
+        
+        if body is None:
+            return json_response(_ERR_INVALID_JSON, 400)
         
         if not body:
-            return jsonify({
-                "success": False,
-                "error": "Request body required"
-            }), 400
+            return json_response(_ERR_BODY_REQUIRED, 400)
         
         # Validate required fields
         user_id = body.get("user_id")
         message = body.get("message")
         
         if not user_id:
-            return jsonify({
-                "success": False,
-                "error": "Missing required field: user_id"
-            }), 400
+            return json_response(_ERR_MISSING_USER_ID, 400)
         
         if not message:
-            return jsonify({
-                "success": False,
-                "error": "Missing required field: message"
-            }), 400
+            return json_response(_ERR_MISSING_MESSAGE, 400)
         
         # Get user name (optional, defaults to user_id)
         user_name = body.get("user_name", user_id)
@@ -102,35 +112,32 @@ def chat():
             service = _get_conversation_service()
         except RuntimeError as e:
             _logger.error(f"Service unavailable: {e}")
-            return jsonify({
-                "success": False,
-                "error": "Service temporarily unavailable"
-            }), 503
+            return json_response(_ERR_SERVICE_UNAVAILABLE, 503)
         
         # Process message
         response = service.process_message(conversation_request)
         
         # Build API response
         if response.success:
-            return jsonify({
+            return ojsonify({
                 "success": True,
                 "response": response.response_text,
                 "user_id": response.user_id,
                 "metadata": response.metadata
-            }), 200
+            }, 200)
         else:
-            return jsonify({
+            return ojsonify({
                 "success": False,
                 "error": response.error or "Failed to process message",
                 "user_id": response.user_id
-            }), 500
+            }, 500)
             
     except Exception as e:
         _logger.error(f"Error in chat endpoint: {e}", exc_info=True)
-        return jsonify({
+        return ojsonify({
             "success": False,
             "error": f"Internal error: {str(e)}"
-        }), 500
+        }, 500)
 
 
 @chat_blueprint.route("/api/chat/history/<user_id>", methods=["GET"])
@@ -150,29 +157,26 @@ def get_conversation_history(user_id: str):
             service = _get_conversation_service()
         except RuntimeError as e:
             _logger.error(f"Service unavailable: {e}")
-            return jsonify({
-                "success": False,
-                "error": "Service temporarily unavailable"
-            }), 503
+            return json_response(_ERR_SERVICE_UNAVAILABLE, 503)
         
         # Get conversation history
         history = service.get_conversation_history(user_id)
         
         if history:
-            return jsonify({
+            return ojsonify({
                 "success": True,
                 "history": history
-            }), 200
+            }, 200)
         else:
-            return jsonify({
+            return ojsonify({
                 "success": False,
                 "error": "Failed to retrieve conversation history"
-            }), 500
+            }, 500)
             
     except Exception as e:
         _logger.error(f"Error getting conversation history: {e}", exc_info=True)
-        return jsonify({
+        return ojsonify({
             "success": False,
             "error": f"Internal error: {str(e)}"
-        }), 500
+        }, 500)
 
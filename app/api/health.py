@@ -1,12 +1,52 @@
 """Health check endpoints."""
 import logging
-from flask import Blueprint, jsonify
+import threading
+import time
+from flask import Blueprint, Response
 from app.infrastructure.redis_client import RedisClientFactory
 from app.config.settings import Config
+from app.utils.fastjson import ojsonify
 
 health_blueprint = Blueprint("health", __name__)
 _logger = logging.getLogger(__name__)
 
+# Probe responses never change, so serialize them once at import time
+_HEALTHY_BODY = b'{"status":"healthy","service":"message-bot"}'
+_LIVE_BODY = b'{"status":"alive","service":"message-bot"}'
+
+# Readiness probes reuse the last Redis ping result for a few seconds
+_READINESS_TTL = 5.0
+_redis_check_cache = {"ts": 0.0, "ok": False}
+_redis_check_lock = threading.Lock()
+
+
+def _check_redis() -> bool:
+    """
+    Check Redis connectivity, caching the result for ``_READINESS_TTL`` seconds.
+    
+    Returns:
+        True if Redis answered the last ping, False otherwise
+    """
+    if time.monotonic() - _redis_check_cache["ts"] < _READINESS_TTL:
+        return _redis_check_cache["ok"]
+    
+    with _redis_check_lock:
+        # Another thread may have refreshed the cache while we waited
+        if time.monotonic() - _redis_check_cache["ts"] < _READINESS_TTL:
+            return _redis_check_cache["ok"]
+        
+        try:
+            redis_client = RedisClientFactory.get_client()
+            redis_client.ping()
+            ok = True
+        except Exception as e:
+            _logger.error(f"Redis health check failed: {e}")
+            ok = False
+        
+        _redis_check_cache["ok"] = ok
+        _redis_check_cache["ts"] = time.monotonic()
+        return ok
+
 
 @health_blueprint.route("/health", methods=["GET"])
 def health_check():
@@ -16,20 +56,7 @@ def health_check():
     Returns:
         JSON response with health status
     """
-    _logger.info("Health check endpoint called")
-    try:
-        response = jsonify({
-            "status": "healthy",
-            "service": "message-bot"
-        })
-        _logger.info("Health check response sent successfully")
-        return response, 200
-    except Exception as e:
-        _logger.error(f"Error in health check: {e}", exc_info=True)
-        return jsonify({
-            "status": "error",
-            "message": str(e)
-        }), 500
+    return Response(_HEALTHY_BODY, status=200, mimetype="application/json")
 
 
 @health_blueprint.route("/health/ready", methods=["GET"])
@@ -45,24 +72,18 @@ def readiness_check():
         "overall": False
     }
     
-    # Check Redis connection
-    try:
-        redis_client = RedisClientFactory.get_client()
-        redis_client.ping()
-        checks["redis"] = True
-    except Exception as e:
-        _logger.error(f"Redis health check failed: {e}")
-        checks["redis"] = False
+    # Check Redis connection (cached for a few seconds)
+    checks["redis"] = _check_redis()
     
     # Overall status
     checks["overall"] = checks["redis"]
     
     status_code = 200 if checks["overall"] else 503
     
-    return jsonify({
+    return ojsonify({
         "status": "ready" if checks["overall"] else "not_ready",
         "checks": checks
-    }), status_code
+    }, status_code)
 
 
 @health_blueprint.route("/health/live", methods=["GET"])
@@ -73,8 +94,5 @@ def liveness_check():
     Returns:
         JSON response with liveness status
     """
-    return jsonify({
-        "status": "alive",
-        "service": "message-bot"
-    }), 200
+    return Response(_LIVE_BODY, status=200, mimetype="application/json")
 
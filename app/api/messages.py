@@ -1,17 +1,65 @@
 """Messages API endpoints for sending messages via configured provider."""
 import logging
-import json
-from typing import Dict, Tuple
+from types import MappingProxyType
+from typing import Callable, Dict
 
-from flask import Blueprint, request, jsonify, current_app
+from flask import Blueprint, Response, request, current_app
 
 from app.decorators.security import signature_required
+from app.domain.interfaces.message_provider import IMessageProvider
+from app.utils import fastjson
+from app.utils.fastjson import json_response, ojsonify
 from app.utils.phone_validator import PhoneNumberValidator
 
 
 messages_blueprint = Blueprint("messages", __name__)
 _logger = logging.getLogger(__name__)
 
+# Constant error bodies, serialized once at import time
+_ERR_BODY_REQUIRED = fastjson.dumps({"status": "error", "message": "Request body required"})
+_ERR_MISSING_TO = fastjson.dumps({"status": "error", "message": "Missing 'to' field"})
+_ERR_MISSING_MESSAGE = fastjson.dumps({"status": "error", "message": "Missing 'message' field"})
+_ERR_INVALID_JSON = fastjson.dumps({"status": "error", "message": "Invalid JSON"})
+
+# Constant leading keys of the send-message response payloads
+_SUCCESS_TEMPLATE = MappingProxyType({"status": "success", "message": "Message accepted"})
+_ERROR_TEMPLATE = MappingProxyType({"status": "error"})
+
+# Friendlier messages for common provider HTTP errors, keyed by status code
+_ERR_MSG_BUILDERS: Dict[int, Callable[[str], str]] = {
+    401: lambda recipient: "Authentication failed. Check your credentials.",
+    403: lambda recipient: (
+        f"Recipient {recipient} not authorized. "
+        f"Add it in provider dashboard if required."
+    ),
+    400: lambda recipient: f"Invalid recipient {recipient}. Check recipient format and permissions.",
+}
+
+
+def _get_message_provider() -> IMessageProvider:
+    """
+    Get message provider from service container.
+    
+    The provider is resolved once per app and cached in ``app.extensions``.
+    
+    Returns:
+        IMessageProvider instance
+        
+    Raises:
+        RuntimeError: If service container is not available
+    """
+    provider = current_app.extensions.get('message_provider')
+    if provider is not None:
+        return provider
+    
+    container = current_app.extensions.get('service_container')
+    if container is None:
+        raise RuntimeError("Service container not available")
+    
+    provider = container.get_message_provider()
+    current_app.extensions['message_provider'] = provider
+    return provider
+
 
 @messages_blueprint.route("/api/send-message", methods=["POST"])
 @signature_required
@@ -31,67 +79,60 @@ def send_message():
         JSON response with status and message details
     """
     try:
-        body = request.get_json()
+        # silent=True returns None for malformed JSON instead of raising
+        body = request.get_json(silent=True)
+        
+        if body is None:
+            return json_response(_ERR_INVALID_JSON, 400)
         
         if not body:
-            return jsonify({"status": "error", "message": "Request body required"}), 400
+            return json_response(_ERR_BODY_REQUIRED, 400)
         
         to_number = body.get("to")
         message_text = body.get("message")
         
         if not to_number:
-            return jsonify({"status": "error", "message": "Missing 'to' field"}), 400
+            return json_response(_ERR_MISSING_TO, 400)
         
         if not message_text:
-            return jsonify({"status": "error", "message": "Missing 'message' field"}), 400
+            return json_response(_ERR_MISSING_MESSAGE, 400)
         
         # Validate and normalize phone number
         try:
             cleaned_digits, api_format = PhoneNumberValidator.normalize(to_number)
         except ValueError as e:
-            return jsonify({"status": "error", "message": str(e)}), 400
+            return ojsonify({"status": "error", "message": str(e)}, 400)
         
-        _logger.info(f"API request: to={to_number}, normalized={api_format}")
+        _logger.info("API request: to=%s, normalized=%s", to_number, api_format)
         
         # Get message provider from service container (configured via MESSAGE_PROVIDER env var)
-        container = current_app.config.get('service_container')
-        if not container:
-            _logger.warning("Service container not in app.config, creating new instance")
-            # Fallback: create container on demand
-            from app.infrastructure.di.service_container import ServiceContainer
-            container = ServiceContainer()
-            current_app.config['service_container'] = container
-        
         try:
-            message_provider = container.get_message_provider()
+            message_provider = _get_message_provider()
         except Exception as e:
-            _logger.error(f"Failed to get message provider: {e}", exc_info=True)
-            return jsonify({"status": "error", "message": f"Service initialization error: {str(e)}"}), 500
+            _logger.error("Failed to get message provider: %s", e, exc_info=True)
+            return ojsonify({"status": "error", "message": f"Service initialization error: {str(e)}"}, 500)
         
         # Send message using provider interface
         result = message_provider.send_text_message(api_format, message_text)
         
         if result is None:
-            return jsonify({
+            return ojsonify({
                 "status": "error",
                 "message": "Connection timeout or network error",
                 "to": cleaned_digits
-            }), 500
+            }, 500)
         
         if result.get("status") == "success":
             return _build_success_response_from_dict(result, cleaned_digits, api_format)
         else:
             return _build_error_response_from_dict(result, cleaned_digits)
             
-    except json.JSONDecodeError:
-        _logger.error("Invalid JSON in request")
-        return jsonify({"status": "error", "message": "Invalid JSON"}), 400
     except Exception as e:
-        _logger.error(f"Error in send-message endpoint: {e}", exc_info=True)
-        return jsonify({"status": "error", "message": f"Internal error: {str(e)}"}), 500
+        _logger.error("Error in send-message endpoint: %s", e, exc_info=True)
+        return ojsonify({"status": "error", "message": f"Internal error: {str(e)}"}, 500)
 
 
-def _build_success_response_from_dict(result: Dict, cleaned_digits: str, api_format: str) -> Tuple[Dict, int]:
+def _build_success_response_from_dict(result: Dict, cleaned_digits: str, api_format: str) -> Response:
     """Build success response from provider result dictionary."""
     response_data = result.get("response", {})
     message_id = result.get("message_id")
@@ -103,44 +144,40 @@ def _build_success_response_from_dict(result: Dict, cleaned_digits: str, api_for
         if normalized_id and normalized_id != cleaned_digits:
             normalized_number = normalized_id
             _logger.warning(
-                f"Recipient normalized: {cleaned_digits} -> {normalized_number}. "
-                f"Add both to allowed recipients list if required."
+                "Recipient normalized: %s -> %s. "
+                "Add both to allowed recipients list if required.",
+                cleaned_digits, normalized_number
             )
     
-    return jsonify({
-        "status": "success",
-        "message": "Message accepted",
+    payload = {
+        **_SUCCESS_TEMPLATE,
         "to": cleaned_digits,
         "sent_to": api_format,
         "normalized_to": normalized_number,
         "message_id": message_id,
         "provider_response": response_data
-    }), 200
+    }
+    return ojsonify(payload, 200)
 
 
-def _build_error_response_from_dict(result: Dict, cleaned_digits: str) -> Tuple[Dict, int]:
+def _build_error_response_from_dict(result: Dict, cleaned_digits: str) -> Response:
     """Build error response from provider result dictionary."""
     error_message = result.get("error_message", "Unknown error")
     error_code = result.get("error_code")
     http_status = result.get("http_status", 500)
 
     # Special handling for common errors
-    if http_status == 401:
-        error_message = "Authentication failed. Check your credentials."
-    elif http_status == 403:
-        error_message = (
-            f"Recipient {cleaned_digits} not authorized. "
-            f"Add it in provider dashboard if required."
-        )
-    elif http_status == 400:
-        error_message = f"Invalid recipient {cleaned_digits}. Check recipient format and permissions."
-
-    _logger.error(f"Failed to send message: {error_message}")
-
-    return jsonify({
-        "status": "error",
+    builder = _ERR_MSG_BUILDERS.get(http_status)
+    if builder is not None:
+        error_message = builder(cleaned_digits)
+
+    _logger.error("Failed to send message: %s", error_message)
+
+    payload = {
+        **_ERROR_TEMPLATE,
         "message": error_message,
         "to": cleaned_digits,
         "http_status": http_status
-    }), http_status
+    }
+    return ojsonify(payload, http_status)
 
@@ -1,169 +1,196 @@
 """Webhook API endpoints for receiving events from configured message provider."""
 import logging
-import json
-from typing import Dict, Any, Tuple
+import threading
+from typing import Dict, Any, List, Optional, Tuple, TYPE_CHECKING
 
-from flask import Blueprint, request, jsonify, current_app
+from flask import Blueprint, Response, request, current_app
 
 from app.decorators.security import signature_required
+from app.utils.fastjson import json_response
 from app.utils.webhook_parser import WebhookParser
 from app.middleware.monitoring import track_message_processing
 
-# Try to import Celery task, but don't fail if Celery is not available
+if TYPE_CHECKING:
+    from app.infrastructure.adapters.message_handler import MessageHandler
+
+# Celery task is imported on first POST (see _lazy_init), not at import time
 CELERY_AVAILABLE = False
 process_message_task = None
-celery_app = None
 
-try:
-    from app.tasks.message_tasks import process_message_task
-    from app.infrastructure.celery_app import celery_app
-    CELERY_AVAILABLE = True
-except Exception:
-    pass
+# Errors raised by delay() when the broker cannot be reached or times out
+# (socket.timeout is an alias of TimeoutError)
+_BROKER_ERRORS: Tuple[type, ...] = (ConnectionError, TimeoutError)
+
+_CELERY_INITIALIZED = False
+_celery_init_lock = threading.Lock()
 
 
 webhook_blueprint = Blueprint("webhook", __name__)
 _logger = logging.getLogger(__name__)
 
+# Constant response bodies, pre-serialized once at import time. A fresh
+# Response is still built per request since Flask-Limiter adds headers to it.
+_OK_BODY = b'{"status":"ok"}'
+_ERR_EMPTY_BODY = b'{"status":"error","message":"Empty request body"}'
+_ERR_INVALID_JSON = b'{"status":"error","message":"Invalid JSON"}'
+_ERR_SERVICE_UNAVAILABLE = b'{"status":"error","message":"Service not available"}'
+_ERR_INVALID_EVENT = b'{"status":"error","message":"Not a valid message event"}'
+
 
-def _handle_status_updates(webhook_body: Dict[str, Any]) -> None:
-    """Handle message status update webhooks from provider."""
-    statuses = WebhookParser.extract_statuses(webhook_body)
+def _lazy_init() -> None:
+    """Import the Celery task once, on first use; don't fail if Celery is not available."""
+    global CELERY_AVAILABLE, process_message_task, _BROKER_ERRORS, _CELERY_INITIALIZED
     
-    for status in statuses:
-        message_id = status.get("id", "unknown")
-        status_type = status.get("status", "unknown")
-        recipient_id = status.get("recipient_id", "unknown")
-        timestamp = status.get("timestamp", "unknown")
-        
-        _logger.info(
-            f"Status update: message_id={message_id}, status={status_type}, "
-            f"recipient={recipient_id}, timestamp={timestamp}"
-        )
-        
-        if status_type == "failed":
-            errors = status.get("errors", [])
-            _logger.error(f"Message {message_id} failed: {errors}")
+    if _CELERY_INITIALIZED:
+        return
+    
+    with _celery_init_lock:
+        if _CELERY_INITIALIZED:
+            return
+        try:
+            from kombu.exceptions import OperationalError
+            from app.tasks.message_tasks import process_message_task as task
+            process_message_task = task
+            _BROKER_ERRORS = (OperationalError, ConnectionError, TimeoutError)
+            CELERY_AVAILABLE = True
+        except Exception as e:
+            _logger.warning("Celery not available, messages will be processed synchronously: %s", e)
+        _CELERY_INITIALIZED = True
+
+
+def _get_message_handler() -> Optional["MessageHandler"]:
+    """
+    Get message handler from service container.
+    
+    The handler is bound at startup (or on first use) and cached in ``app.extensions``.
+    
+    Returns:
+        MessageHandler instance, or None if the service container is not available
+    """
+    handler = current_app.extensions.get('message_handler')
+    if handler is not None:
+        return handler
+    
+    container = current_app.extensions.get('service_container')
+    if container is None:
+        return None
+    
+    handler = container.get_message_handler()
+    current_app.extensions['message_handler'] = handler
+    return handler
+
+
+def _handle_status_updates(statuses: List[Dict[str, Any]]) -> None:
+    """
+    Handle message status updates extracted from a provider webhook.
+    
+    Emits one log record per webhook (plus one for failures) rather than one
+    per status; the per-status fields are attached as ``extra["statuses"]``
+    for structured log consumers.
+    """
+    if _logger.isEnabledFor(logging.INFO):
+        entries = [
+            {
+                "id": status.get("id", "unknown"),
+                "status": status.get("status", "unknown"),
+                "recipient_id": status.get("recipient_id", "unknown"),
+                "timestamp": status.get("timestamp", "unknown"),
+            }
+            for status in statuses
+        ]
+        _logger.info("Status updates (%d): %s", len(entries), entries, extra={"statuses": entries})
+    
+    failed = [
+        {"id": status.get("id", "unknown"), "errors": status.get("errors", [])}
+        for status in statuses
+        if status.get("status") == "failed"
+    ]
+    if failed:
+        _logger.error("Messages failed (%d): %s", len(failed), failed, extra={"statuses": failed})
 
 
-def handle_message() -> Tuple[str, int]:
+def handle_message() -> Response:
     """
     Handle incoming webhook events from configured message provider.
     
     Uses Celery for asynchronous message processing to return immediately.
     
     Returns:
-        Tuple of (response, status_code)
+        JSON response
     """
-    body = request.get_json()
+    # Reject empty POSTs (probes, scanners) before touching the JSON parser
+    if not request.content_length:
+        return json_response(_ERR_EMPTY_BODY, 400)
     
-    if not body:
-        return jsonify({"status": "error", "message": "Empty request body"}), 400
+    # silent=True returns None for malformed JSON instead of raising
+    body = request.get_json(silent=True)
     
+    if body is None:
+        return json_response(_ERR_INVALID_JSON, 400)
     
-    # Handle status updates (synchronous, fast)
-    if WebhookParser.is_status_update(body):
-        _handle_status_updates(body)
-        return jsonify({"status": "ok"}), 200
+    if not body:
+        return json_response(_ERR_EMPTY_BODY, 400)
     
-    # Handle incoming messages
     try:
-        if WebhookParser.is_valid_message(body):
-            # Extract user_id for metrics (provider-agnostic)
-            user_id = "unknown"
-            try:
-                # Try to get user_id from parsed message (provider-specific parsing)
-                container = current_app.config.get('service_container')
-                if container:
-                    message_provider = container.get_message_provider()
-                    parsed = message_provider.parse_webhook(body)
-                    if parsed:
-                        user_id = parsed.get("user_id", "unknown")
-            except (KeyError, IndexError, Exception):
-                # Fallback: try to extract from webhook structure
-                try:
-                    user_id = body["entry"][0]["changes"][0]["value"].get("contacts", [{}])[0].get("wa_id") or \
-                              body["entry"][0]["changes"][0]["value"].get("messages", [{}])[0].get("from", "unknown")
-                except (KeyError, IndexError):
-                    user_id = "unknown"
+        # Classify the payload once; branches below read the parsed fields
+        event = WebhookParser.parse(body)
+        
+        # Handle status updates (synchronous, fast)
+        if event.kind == "status":
+            _handle_status_updates(event.statuses)
+            return json_response(_OK_BODY, 200)
+        
+        # Handle incoming messages
+        if event.kind == "message":
+            # User id for metrics and logs
+            user_id = event.wa_id
             
-            # Try async processing with Celery first, fallback to sync if unavailable
+            # Acknowledge message types the provider can't process (media,
+            # reactions, ...) here instead of queueing a task that would drop them
+            provider = current_app.extensions.get('message_provider')
+            if provider is not None and not provider.is_user_message(body):
+                _logger.info("Ignoring unsupported message from %s", user_id)
+                return json_response(_OK_BODY, 200)
+            
+            # Queue for async processing with Celery; the broker holds the task
+            # until a worker is available. Only fall back to sync processing
+            # when the broker itself cannot be reached.
             use_async = False
-            if CELERY_AVAILABLE and celery_app:
+            _lazy_init()
+            if CELERY_AVAILABLE:
                 try:
-                    # Check if Celery workers are available (with timeout)
-                    try:
-                        inspect = celery_app.control.inspect(timeout=2.0)
-                        active_workers = inspect.active()
-                        
-                        if not active_workers:
-                            use_async = False
-                        else:
-                            task = process_message_task.delay(body)
-                            _logger.info(f"Message queued for async processing: task_id={task.id}, user_id={user_id}")
-                            track_message_processing(user_id, True)
-                            use_async = True
-                    except Exception:
-                        use_async = False
-                except Exception:
-                    use_async = False
+                    # Enqueue the raw body: kombu serializes a str far cheaper than
+                    # re-encoding the decoded dict, and the worker decodes it once
+                    task = process_message_task.delay(request.get_data(as_text=True))
+                    _logger.info("Message queued for async processing: task_id=%s, user_id=%s", task.id, user_id)
+                    track_message_processing(user_id, True)
+                    use_async = True
+                except _BROKER_ERRORS as e:
+                    _logger.warning("Celery broker unavailable, processing synchronously: %s", e)
             
             # If async failed, process synchronously (like before)
             if not use_async:
                 try:
-                    container = current_app.config.get('service_container')
-                    if not container:
+                    message_handler = _get_message_handler()
+                    if message_handler is None:
                         _logger.error("Service container not available")
-                        return jsonify({"status": "error", "message": "Service not available"}), 500
+                        return json_response(_ERR_SERVICE_UNAVAILABLE, 500)
                     
-                    message_handler = container.get_message_handler()
                     message_handler.process_incoming_message(body)
-                    _logger.info(f"Message processed synchronously for {user_id}")
+                    _logger.info("Message processed synchronously for %s", user_id)
                     track_message_processing(user_id, True)
                 except Exception as e:
-                    _logger.error(f"Error processing message: {e}", exc_info=True)
+                    _logger.error("Error processing message: %s", e, exc_info=True)
                     track_message_processing(user_id, False)
             
-            return jsonify({"status": "ok"}), 200
+            return json_response(_OK_BODY, 200)
         else:
             _logger.warning("Received invalid message event")
-            return jsonify({"status": "error", "message": "Not a valid message event"}), 404
+            return json_response(_ERR_INVALID_EVENT, 404)
             
-    except json.JSONDecodeError:
-        _logger.error("Failed to decode JSON")
-        return jsonify({"status": "error", "message": "Invalid JSON"}), 400
     except Exception as e:
-        _logger.error(f"Unexpected error: {e}", exc_info=True)
-        return jsonify({"status": "ok"}), 200  # Return success to prevent retries
-
-
-def verify() -> Tuple[str, int]:
-    """
-    Verify webhook subscription (required by some providers).
-    
-    Returns:
-        Tuple of (challenge, status_code) or (error_response, status_code)
-    """
-    mode = request.args.get("hub.mode")
-    token = request.args.get("hub.verify_token")
-    challenge = request.args.get("hub.challenge")
-    
-    if not (mode and token):
-        _logger.info("MISSING_PARAMETER")
-        return jsonify({"status": "error", "message": "Missing parameters"}), 400
-    
-    if mode == "subscribe" and token == current_app.config["VERIFY_TOKEN"]:
-        _logger.info("WEBHOOK_VERIFIED")
-        return challenge, 200
-    else:
-        _logger.info("VERIFICATION_FAILED")
-        return jsonify({"status": "error", "message": "Verification failed"}), 403
-
-
-@webhook_blueprint.route("/webhook", methods=["GET"])
-def webhook_get():
-    """Handle webhook verification (GET request)."""
-    return verify()
+        _logger.error("Unexpected error: %s", e, exc_info=True)
+        return json_response(_OK_BODY, 200)  # Return success to prevent retries
 
 
 @webhook_blueprint.route("/webhook", methods=["POST"])
@@ -1,12 +1,14 @@
 """Authentication service for Starlings API."""
-import json
 import logging
-from typing import Dict, Any, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
 
 from app.infrastructure.clients.starlings_api_client import StarlingsAPIClient
 from app.domain.interfaces.session_storage import ISessionStorage
 from app.infrastructure.repositories.session_storage import RedisSessionStorage
 from app.config.settings import Config
+from app.utils import fastjson
 
 
 logger = logging.getLogger(__name__)
@@ -24,6 +26,15 @@ class AuthenticationService:
     5. Store all data in session
     """
     
+    # Sessions only change on re-authentication, so reads are served from an
+    # in-process copy for a few seconds. Shared by all instances in the
+    # process (handlers may build a new service per call).
+    _SESSION_CACHE_TTL = 5.0
+    _session_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+    
+    # Company users roster is reused across authentications for 5 minutes
+    _USERS_CACHE_TTL = 300
+    
     def __init__(
         self,
         api_client: Optional[StarlingsAPIClient] = None,
@@ -36,9 +47,8 @@ class AuthenticationService:
             api_client: Starlings API client instance (Dependency Injection)
             session_storage: Session storage instance (Dependency Injection)
         """
-        self.api_client = api_client or StarlingsAPIClient()
+        self.api_client = api_client or StarlingsAPIClient.get_shared()
         self.session_storage = session_storage or RedisSessionStorage()
-        self._logger = logging.getLogger(__name__)
         self._session_id = "default"  # Single global session for now
     
     def authenticate(self, phone_number: Optional[str] = None) -> Dict[str, Any]:
@@ -59,11 +69,11 @@ class AuthenticationService:
         if not phone_number:
             raise ValueError("Phone number is required for authentication")
         
-        self._logger.info("Starting authentication flow...")
+        logger.info("Starting authentication flow...")
         
         try:
             # Step 1: Initial login with API key
-            self._logger.info("Step 1: Logging in with API key...")
+            logger.debug("Step 1: Logging in with API key...")
             login_response = self.api_client.login()
             
             access_token = login_response.get("token")
@@ -73,10 +83,14 @@ class AuthenticationService:
             if not access_token or not tenant:
                 raise ValueError("Invalid login response: missing token or tenant")
             
-            self._logger.info(f"Login successful - Token: {access_token[:20]}..., Tenant: {tenant[:20]}...")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Login successful",
+                    extra={"token_prefix": access_token[:20], "tenant_prefix": tenant[:20]}
+                )
             
             # Step 2: Refresh token with phone number
-            self._logger.info("Step 2: Refreshing token with phone number...")
+            logger.debug("Step 2: Refreshing token with phone number...")
             refresh_response = self.api_client.refresh_token(phone_number, access_token, tenant)
             
             # Update access token from refresh response
@@ -88,31 +102,40 @@ class AuthenticationService:
             )
             if new_access_token != access_token:
                 access_token = new_access_token
-                self._logger.info("Token refreshed successfully")
+                logger.debug("Token refreshed successfully")
             else:
-                self._logger.info("Token refresh completed (using existing token)")
+                logger.debug("Token refresh completed (using existing token)")
             
-            # Step 3: Get user information
-            self._logger.info("Step 3: Fetching user information...")
-            user_response = self.api_client.get_user(access_token, tenant)
-            
-            # Step 4: Get organization information
-            # Extract domain ID from organization
+            # Extract domain ID from organization (needed for step 4)
             domain_id = None
             if organization and organization.get("domains") and len(organization["domains"]) > 0:
                 domain_id = organization["domains"][0].get("id")
             
-            if not domain_id:
-                self._logger.warning("No domain ID found in organization, skipping organization fetch")
-                organization_data = organization
-            else:
-                self._logger.info(f"Step 4: Fetching organization for domain {domain_id}...")
-                organization_data = self.api_client.get_organization(domain_id, access_token, tenant)
+            # Steps 3 and 4 only depend on the refreshed token, so the user and
+            # organization lookups run concurrently
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                # Step 3: Get user information
+                logger.debug("Step 3: Fetching user information...")
+                user_future = executor.submit(self.api_client.get_user, access_token, tenant)
+                
+                # Step 4: Get organization information
+                if not domain_id:
+                    logger.warning("No domain ID found in organization, skipping organization fetch")
+                    organization_data = organization
+                else:
+                    logger.debug("Step 4: Fetching organization for domain %s...", domain_id)
+                    organization_data = executor.submit(
+                        self.api_client.get_organization, domain_id, access_token, tenant
+                    ).result()
+                
+                user_response = user_future.result()
             
             # Step 5: Build initial session data
             session_data = {
                 "access_token": access_token,
                 "tenant": tenant,
+                # Ready-to-use request headers, so readers don't rebuild them per call
+                "auth_headers": self._build_auth_headers(tenant, access_token),
                 "organization": organization_data,
                 "user": user_response,
                 "buyer": organization_data.get("buyer") if isinstance(organization_data, dict) else None,
@@ -123,16 +146,15 @@ class AuthenticationService:
             session_data["organization_type"] = "company"
             
             highest_role = user_response.get("highestRole", "")
-            self._logger.info(f"User highest role: {highest_role}")
             
             if highest_role == "basic-user":
                 # For basic users, only include themselves
-                session_data["users"] = json.dumps([user_response])
-                session_data["feathers_passengers"] = json.dumps([{
+                session_data["users"] = fastjson.dumps([user_response]).decode("utf-8")
+                session_data["feathers_passengers"] = fastjson.dumps([{
                     "user_id": user_response.get("id"),
                     "cost_center_id": None
-                }])
-                self._logger.info("Basic user detected - set users and feathers_passengers to current user only")
+                }]).decode("utf-8")
+                logger.debug("Basic user detected - set users and feathers_passengers to current user only")
             else:
                 # For other roles, fetch all company users
                 organization_id = None
@@ -140,39 +162,89 @@ class AuthenticationService:
                     organization_id = organization_data.get("id")
                 
                 if organization_id:
-                    self._logger.info(f"Step 6: Fetching users for company {organization_id}...")
-                    users_response = self.api_client.get_users(
-                        company_id=organization_id,
-                        access_token=access_token,
-                        tenant=tenant,
-                        page=1,
-                        per_page=9999,
-                        with_roles=False,
-                        only_active=True
-                    )
-                    # Store the data array from response
-                    session_data["users"] = users_response.get("data", [])
-                    self._logger.info(f"Retrieved {len(session_data['users'])} users for company")
+                    session_data["users"] = self._get_company_users(organization_id, access_token, tenant)
                 else:
-                    self._logger.warning("No organization ID found - cannot fetch users")
+                    logger.warning("No organization ID found - cannot fetch users")
                     session_data["users"] = []
             
             # Add cost centers from user data
             cost_centers = user_response.get("cost_centers", [])
             session_data["cost_centers"] = cost_centers
-            self._logger.info(f"Added {len(cost_centers)} cost centers to session")
             
             # Store session
             self.session_storage.set_session(self._session_id, session_data)
-            self._logger.info("Authentication flow completed successfully")
-            self._logger.info(f"Session stored with ID: {self._session_id}")
+            self._session_cache[self._session_id] = (time.monotonic(), session_data)
+            logger.info(
+                "Authentication flow completed for session %s (role %s)",
+                self._session_id, highest_role,
+                extra={
+                    "session_id": self._session_id,
+                    "highest_role": highest_role,
+                    "cost_centers": len(cost_centers),
+                }
+            )
             
             return session_data
             
         except Exception as e:
-            self._logger.error(f"Authentication failed: {e}", exc_info=True)
+            logger.error("Authentication failed: %s", e, exc_info=True)
             raise
     
+    def _get_company_users(self, organization_id: str, access_token: str, tenant: str) -> List[Dict[str, Any]]:
+        """
+        Get the company users roster, cached for ``_USERS_CACHE_TTL`` seconds.
+        
+        The roster rarely changes between authentications but can be very
+        large, so it is kept in session storage under its own key instead of
+        being re-downloaded on every authentication. The whole list is stored
+        as a single field, so it is encoded once and keeps the API's order.
+        
+        Args:
+            organization_id: Company (organization) identifier
+            access_token: Current access token
+            tenant: Tenant identifier
+            
+        Returns:
+            List of user dictionaries
+        """
+        cache_id = self._users_cache_id(organization_id)
+        cached = self.session_storage.get_session_fields(cache_id, "users")
+        if cached and cached.get("users") is not None:
+            logger.debug("Step 6: Using cached users for company %s", organization_id)
+            return cached["users"]
+        
+        logger.debug("Step 6: Fetching users for company %s...", organization_id)
+        users = []
+        for page in self.api_client.get_users_paginated(
+            company_id=organization_id,
+            access_token=access_token,
+            tenant=tenant,
+            with_roles=False,
+            only_active=True
+        ):
+            users.extend(page)
+        logger.debug("Retrieved %s users for company", len(users))
+        
+        try:
+            self.session_storage.set_session(cache_id, {"users": users}, ttl=self._USERS_CACHE_TTL)
+        except Exception as e:
+            logger.warning("Failed to cache users for company %s: %s", organization_id, e)
+        return users
+    
+    def invalidate_users_cache(self, organization_id: str) -> None:
+        """
+        Drop the cached users roster so the next authentication re-fetches it.
+        
+        Args:
+            organization_id: Company (organization) identifier
+        """
+        self.session_storage.delete_session(self._users_cache_id(organization_id))
+    
+    @staticmethod
+    def _users_cache_id(organization_id: str) -> str:
+        """Session storage id of a company's cached users roster."""
+        return f"starlings:roster:{organization_id}"
+    
     def get_session(self) -> Optional[Dict[str, Any]]:
         """
         Retrieve current session data.
@@ -180,7 +252,21 @@ class AuthenticationService:
         Returns:
             Session data dictionary or None if not authenticated
         """
-        return self.session_storage.get_session(self._session_id)
+        session = self._get_cached_session()
+        if session is not None:
+            return session
+        
+        session = self.session_storage.get_session(self._session_id)
+        if session is not None:
+            self._session_cache[self._session_id] = (time.monotonic(), session)
+        return session
+    
+    def _get_cached_session(self) -> Optional[Dict[str, Any]]:
+        """Return the in-process session copy if it is still fresh."""
+        cached = self._session_cache.get(self._session_id)
+        if cached is not None and time.monotonic() - cached[0] < self._SESSION_CACHE_TTL:
+            return cached[1]
+        return None
     
     def is_authenticated(self) -> bool:
         """
@@ -189,7 +275,9 @@ class AuthenticationService:
         Returns:
             True if authenticated, False otherwise
         """
-        session = self.get_session()
+        session = self._get_cached_session() or self.session_storage.get_session_fields(
+            self._session_id, "access_token"
+        )
         return session is not None and session.get("access_token") is not None
     
     def get_auth_headers(self) -> Dict[str, str]:
@@ -202,18 +290,29 @@ class AuthenticationService:
         Raises:
             ValueError: If not authenticated
         """
-        session = self.get_session()
-        if not session:
+        # Only the header fields are read, not the whole session (users list etc.)
+        session = self._get_cached_session() or self.session_storage.get_session_fields(
+            self._session_id, "auth_headers", "tenant", "access_token"
+        )
+        if not session or not session.get("access_token"):
             raise ValueError("Not authenticated. Please run authentication flow first.")
         
+        # Sessions stored before headers were precomputed only have tenant/token
+        headers = session.get("auth_headers") or self._build_auth_headers(
+            session["tenant"], session["access_token"]
+        )
+        return dict(headers)
+    
+    @staticmethod
+    def _build_auth_headers(tenant: str, access_token: str) -> Dict[str, str]:
+        """Build the Tenant/Authorization headers for a token."""
         return {
-            "Tenant": session["tenant"],
-            "Authorization": f"Bearer {session['access_token']}"
+            "Tenant": tenant,
+            "Authorization": f"Bearer {access_token}"
         }
     
     @staticmethod
     def _get_timestamp() -> str:
-        """Get current timestamp as ISO string."""
-        from datetime import datetime
-        return datetime.utcnow().isoformat() + "Z"
+        """Get current UTC timestamp as ISO string (second precision)."""
+        return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
 
@@ -4,7 +4,8 @@ This service handles AI conversation logic independently of message providers.
 Can be used by both WhatsApp webhooks and frontend API endpoints.
 """
 import logging
-from typing import Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional
 from dataclasses import dataclass
 
 from app.domain.interfaces.ai_provider import IAIProvider
@@ -13,7 +14,7 @@ from app.domain.interfaces.ai_provider import IAIProvider
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class ConversationRequest:
     """Request for conversation service."""
     user_id: str
@@ -22,7 +23,7 @@ class ConversationRequest:
     context: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ConversationResponse:
     """Response from conversation service."""
     response_text: str
@@ -53,7 +54,8 @@ class ConversationService:
             ai_provider: AI provider for generating responses
         """
         self.ai_provider = ai_provider
-        self._logger = logging.getLogger(__name__)
+        self._generate = ai_provider.generate_response
+        self._lookup_cached = ai_provider.lookup_cached_response
     
     def process_message(self, request: ConversationRequest) -> ConversationResponse:
         """
@@ -71,10 +73,8 @@ class ConversationService:
             Conversation response with AI-generated text
         """
         try:
-            self._logger.info(
-                f"Processing message for user {request.user_id}: "
-                f"{request.message[:50]}..."
-            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Processing message for user %s: %s...", request.user_id, request.message[:50])
             
             # Generate AI response
             # The AI provider handles:
@@ -82,11 +82,13 @@ class ConversationService:
             # - Context management
             # - Function calling
             # - Response generation
-            response_text = self.ai_provider.generate_response(
-                message_body=request.message,
-                user_id=request.user_id,
-                user_name=request.user_name
-            )
+            response_text = self._lookup_cached(request.message, request.user_id)
+            if response_text is None:
+                response_text = self._generate(
+                    message_body=request.message,
+                    user_id=request.user_id,
+                    user_name=request.user_name
+                )
             
             return ConversationResponse(
                 response_text=response_text,
@@ -99,8 +101,8 @@ class ConversationService:
             )
             
         except Exception as e:
-            self._logger.error(
-                f"Error processing message for user {request.user_id}: {e}",
+            logger.error(
+                "Error processing message for user %s: %s", request.user_id, e,
                 exc_info=True
             )
             return ConversationResponse(
@@ -110,6 +112,31 @@ class ConversationService:
                 error=str(e)
             )
     
+    def process_messages(
+        self,
+        requests: List[ConversationRequest],
+        max_concurrency: int = 8
+    ) -> List[ConversationResponse]:
+        """
+        Process several messages, generating AI responses concurrently.
+        
+        AI calls are I/O bound, so a batch (e.g. from a frontend test or replay
+        tool) takes roughly as long as its slowest request instead of the sum.
+        
+        Args:
+            requests: Conversation requests to process
+            max_concurrency: Maximum number of AI calls in flight
+            
+        Returns:
+            Conversation responses, in the same order as the requests
+        """
+        if len(requests) <= 1:
+            return [self.process_message(request) for request in requests]
+        
+        workers = min(max_concurrency, len(requests))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="conversation") as executor:
+            return list(executor.map(self.process_message, requests))
+    
     def get_conversation_history(self, user_id: str) -> Optional[Dict[str, Any]]:
         """
         Get conversation history for a user.
@@ -137,6 +164,6 @@ class ConversationService:
                     "has_history": False
                 }
         except Exception as e:
-            self._logger.error(f"Error getting conversation history: {e}")
+            logger.error("Error getting conversation history: %s", e)
             return None
 
@@ -1,5 +1,6 @@
 """Use case for processing incoming messages (Use Case Pattern)."""
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any
 
 from app.domain.interfaces.message_provider import IMessageProvider
@@ -13,6 +14,10 @@ from app.utils.text_processor import WhatsAppTextProcessor
 
 logger = logging.getLogger(__name__)
 
+# Typing indicators are sent on background threads so the provider round trip
+# overlaps with AI response generation (threads are only started on first use)
+_typing_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="typing-indicator")
+
 
 class ProcessMessageUseCase:
     """
@@ -37,6 +42,13 @@ class ProcessMessageUseCase:
         self.message_provider = message_provider
         self.conversation_service = conversation_service
         self.text_processor = WhatsAppTextProcessor()
+        
+        # Bound methods used on every message are resolved once here
+        self._parse_webhook = message_provider.parse_webhook
+        self._send_typing = message_provider.send_typing_indicator
+        self._send_text = message_provider.send_text_message
+        self._process_conversation = conversation_service.process_message
+        self._process_text = self.text_processor.process
     
     def execute(self, webhook_body: Dict[str, Any]) -> None:
         """
@@ -49,7 +61,7 @@ class ProcessMessageUseCase:
             webhook_body: Raw webhook payload from message provider
         """
         # Parse webhook into domain entity
-        parsed_data = self.message_provider.parse_webhook(webhook_body)
+        parsed_data = self._parse_webhook(webhook_body)
         if not parsed_data:
             logger.warning("Invalid webhook payload")
             return
@@ -62,11 +74,8 @@ class ProcessMessageUseCase:
             provider=parsed_data["provider"]
         )
         
-        # Send typing indicator (provider-specific)
-        try:
-            self.message_provider.send_typing_indicator(message.message_id)
-        except Exception:
-            pass  # Non-critical
+        # Send typing indicator (provider-specific) while the AI response is generated
+        typing_future = _typing_executor.submit(self._send_typing, message.message_id)
         
         # Use conversation service for AI response (provider-agnostic)
         conversation_request = ConversationRequest(
@@ -75,7 +84,7 @@ class ProcessMessageUseCase:
             message=message.message_body
         )
         
-        conversation_response = self.conversation_service.process_message(conversation_request)
+        conversation_response = self._process_conversation(conversation_request)
         
         if not conversation_response.success:
             logger.error(
@@ -88,13 +97,19 @@ class ProcessMessageUseCase:
             error_message = None
             response_text = conversation_response.response_text
         
+        # Let the typing indicator land before the reply is sent
+        try:
+            typing_future.result()
+        except Exception:
+            pass  # Non-critical
+        
         # Process text for provider-specific formatting
-        processed_text = self.text_processor.process(
+        processed_text = self._process_text(
             error_message if error_message else response_text
         )
         
         # Send response via message provider
-        result = self.message_provider.send_text_message(
+        result = self._send_text(
             recipient=message.user_id,
             message=processed_text
         )
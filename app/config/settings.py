@@ -43,6 +43,8 @@ class Config:
     # Application
     DEBUG: bool = os.getenv("DEBUG", "false").lower() == "true"
     SECRET_KEY: str = os.getenv("SECRET_KEY", "dev-secret-key-change-in-production")
+    # Flask rejects larger request bodies with 413 before they are read
+    MAX_CONTENT_LENGTH: int = int(os.getenv("MAX_CONTENT_LENGTH", str(1024 * 1024)))  # 1 MB default
     
     # Starlings API Configuration
     STARLINGS_API_KEY: Optional[str] = os.getenv("STARLINGS_API_KEY")
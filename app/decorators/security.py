@@ -1,28 +1,31 @@
 from functools import wraps
 from flask import current_app, jsonify, request
 import logging
-import hashlib
 import hmac
 
 
 def validate_signature(payload, signature):
     """
     Validate the incoming payload's signature against our expected signature
+
+    The payload is the raw request body (bytes), hashed as-is without a
+    decode/encode round trip.
     """
     app_secret = current_app.config.get("APP_SECRET")
     if not app_secret:
         logging.warning("APP_SECRET not configured, skipping signature validation")
         return True  # Allow request if APP_SECRET is not set (for development)
     
-    # Use the App Secret to hash the payload
-    expected_signature = hmac.new(
-        bytes(app_secret, "latin-1"),
-        msg=payload.encode("utf-8"),
-        digestmod=hashlib.sha256,
-    ).hexdigest()
+    try:
+        received_digest = bytes.fromhex(signature)
+    except ValueError:
+        return False
+    
+    # Use the App Secret to hash the payload (one-shot OpenSSL HMAC)
+    expected_digest = hmac.digest(bytes(app_secret, "latin-1"), payload, "sha256")
 
     # Check if the signature matches
-    return hmac.compare_digest(expected_signature, signature)
+    return hmac.compare_digest(expected_digest, received_digest)
 
 
 def signature_required(f):
@@ -35,7 +38,7 @@ def signature_required(f):
         signature = request.headers.get("X-Hub-Signature-256", "")[
             7:
         ]  # Removing 'sha256='
-        if not validate_signature(request.data.decode("utf-8"), signature):
+        if not validate_signature(request.data, signature):
             logging.info("Signature verification failed!")
             return jsonify({"status": "error", "message": "Invalid signature"}), 403
         return f(*args, **kwargs)
@@ -4,7 +4,10 @@ from typing import Optional, List
 from datetime import datetime
 
 
-@dataclass
+_VALID_BOOKING_STATUSES = frozenset({"confirmed", "cancelled", "completed"})
+
+
+@dataclass(slots=True)
 class Flight:
     """Domain entity representing a flight option."""
     
@@ -32,7 +35,7 @@ class Flight:
             raise ValueError("price must be non-negative")
 
 
-@dataclass
+@dataclass(slots=True)
 class Booking:
     """Domain entity representing a flight booking."""
     
@@ -63,11 +66,11 @@ class Booking:
             raise ValueError("passengers must be positive")
         if self.total_price < 0:
             raise ValueError("total_price must be non-negative")
-        if self.status not in ["confirmed", "cancelled", "completed"]:
+        if self.status not in _VALID_BOOKING_STATUSES:
             raise ValueError(f"Invalid status: {self.status}")
 
 
-@dataclass
+@dataclass(slots=True)
 class TravelHistory:
     """Domain entity representing a user's travel history."""
     
@@ -7,8 +7,9 @@ This allows switching between different AI services:
 - Local LLMs
 - etc.
 """
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterator
 
 
 class IAIProvider(ABC):
@@ -43,6 +44,79 @@ class IAIProvider(ABC):
         """
         pass
     
+    async def agenerate_response(
+        self,
+        message_body: str,
+        user_id: str,
+        user_name: str,
+        function_handler: Optional[Any] = None
+    ) -> str:
+        """
+        Generate AI response to user message without blocking the event loop.
+        
+        Lets async callers keep several AI calls in flight. The default
+        implementation runs ``generate_response`` in a worker thread;
+        providers with a native async client can override it.
+        
+        Args:
+            message_body: User's message text
+            user_id: Unique user identifier
+            user_name: User's display name
+            function_handler: Optional handler for function calls (deprecated, kept for compatibility)
+            
+        Returns:
+            Generated response text
+            
+        Raises:
+            Exception: If AI service call fails
+        """
+        return await asyncio.to_thread(
+            self.generate_response, message_body, user_id, user_name, function_handler
+        )
+    
+    def lookup_cached_response(self, message_body: str, user_id: str) -> Optional[str]:
+        """
+        Look up a cached response for a message before calling the AI service.
+        
+        Providers with a response cache (exact-match or semantic) can override
+        this so a hit skips generation entirely. The default implementation
+        does not cache and always returns None.
+        
+        Args:
+            message_body: User's message text
+            user_id: Unique user identifier
+            
+        Returns:
+            Cached response text, or None on a cache miss
+        """
+        return None
+    
+    def stream_response(
+        self,
+        message_body: str,
+        user_id: str,
+        user_name: str
+    ) -> Iterator[str]:
+        """
+        Generate AI response to user message as a stream of text chunks.
+        
+        Providers that support token streaming can override this so callers
+        start delivering the answer before generation finishes. The default
+        implementation yields the full ``generate_response`` result once.
+        
+        Args:
+            message_body: User's message text
+            user_id: Unique user identifier
+            user_name: User's display name
+            
+        Yields:
+            Consecutive pieces of the response text
+            
+        Raises:
+            Exception: If AI service call fails
+        """
+        yield self.generate_response(message_body, user_id, user_name)
+    
     @abstractmethod
     def get_thread_id(self, user_id: str) -> Optional[str]:
         """
@@ -1,6 +1,10 @@
 """Interface for conversation repository (Repository Pattern).
 
 Stores conversation history (message arrays) instead of thread IDs.
+
+Messages are (de)serialized on every turn, so implementations should encode
+them with ``app.utils.fastjson`` (orjson when installed) and hand the
+resulting bytes to the backend directly.
 """
 from abc import ABC, abstractmethod
 from typing import Optional, List, Dict, Any
@@ -28,6 +32,38 @@ class IConversationRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    def get_conversation_tail(self, user_id: str, n: int) -> Optional[List[Dict[str, Any]]]:
+        """
+        Retrieve only the most recent messages of a conversation.
+        
+        Implementations should slice on the storage side (e.g. ``LRANGE key -n -1``)
+        so long histories are not transferred and decoded just to be trimmed.
+        
+        Args:
+            user_id: User identifier
+            n: Number of most recent messages to return (must be positive)
+            
+        Returns:
+            Up to ``n`` messages in OpenAI format, or None if no conversation exists
+        """
+        pass
+    
+    @abstractmethod
+    def get_conversations(self, user_ids: List[str]) -> Dict[str, Optional[List[Dict[str, Any]]]]:
+        """
+        Retrieve conversation histories for several users at once.
+        
+        Implementations should fetch all of them in a single round trip.
+        
+        Args:
+            user_ids: User identifiers
+            
+        Returns:
+            Dictionary mapping each user ID to its messages, or None if it has no conversation
+        """
+        pass
+    
     @abstractmethod
     def save_conversation(
         self,
@@ -72,6 +108,47 @@ class IConversationRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    def add_messages(
+        self,
+        user_id: str,
+        messages: List[Dict[str, Any]],
+        extend_ttl: bool = True,
+        max_len: Optional[int] = None
+    ) -> bool:
+        """
+        Append several messages to the conversation history at once.
+        
+        Implementations should store the whole batch in a single round trip
+        (e.g. one pipelined RPUSH), so a turn with tool calls costs one write.
+        With ``max_len`` the history works as a sliding window: only the most
+        recent ``max_len`` messages are kept.
+        
+        Args:
+            user_id: User identifier
+            messages: Messages in OpenAI format, in conversation order
+            extend_ttl: Whether to reset the conversation time-to-live
+            max_len: Optional maximum number of messages to keep
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        pass
+    
+    def append_message(self, user_id: str, message: Dict[str, Any], max_len: int) -> bool:
+        """
+        Append one message and trim the history to the last ``max_len`` messages.
+        
+        Args:
+            user_id: User identifier
+            message: Message in OpenAI format
+            max_len: Maximum number of messages to keep
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        return self.add_messages(user_id, [message], max_len=max_len)
+    
     @abstractmethod
     def delete_conversation(self, user_id: str) -> bool:
         """
@@ -85,11 +162,31 @@ class IConversationRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    def delete_conversations(self, user_ids: List[str]) -> int:
+        """
+        Delete the conversations of several users (e.g. a data purge).
+        
+        Implementations should delete them in one round trip and, where the
+        backend supports it, reclaim storage without blocking (e.g. UNLINK).
+        
+        Args:
+            user_ids: User identifiers
+            
+        Returns:
+            Number of conversations deleted
+        """
+        pass
+    
     @abstractmethod
     def extend_ttl(self, user_id: str) -> bool:
         """
         Extend time-to-live for conversation.
         
+        Expiry is the primary eviction mechanism. Implementations should only
+        write the new expiry when it is later than the current one, so
+        refreshing an already-fresh conversation does not cost a write.
+        
         Args:
             user_id: User identifier
             
@@ -98,12 +195,40 @@ class IConversationRepository(ABC):
         """
         pass
     
+    def get_conversation_and_touch(
+        self,
+        user_id: str,
+        last_n: Optional[int] = None
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Retrieve conversation history and reset its time-to-live.
+        
+        Implementations should override this to do both in one round trip.
+        The default implementation calls ``get_conversation`` (or
+        ``get_conversation_tail``) and ``extend_ttl``.
+        
+        Args:
+            user_id: User identifier
+            last_n: Optional number of most recent messages to return
+            
+        Returns:
+            List of messages in OpenAI format, or None if no conversation exists
+        """
+        if last_n:
+            messages = self.get_conversation_tail(user_id, last_n)
+        else:
+            messages = self.get_conversation(user_id)
+        if messages is not None:
+            self.extend_ttl(user_id)
+        return messages
+    
     @abstractmethod
     def clear_old_messages(self, user_id: str, keep_last_n: int = 20) -> bool:
         """
         Clear old messages, keeping only the last N messages.
         
-        Useful for managing context window size.
+        Deprecated: pass ``max_len`` to ``add_messages``/``append_message`` so
+        the history is trimmed as it is written instead.
         
         Args:
             user_id: User identifier
@@ -49,6 +49,10 @@ class IFunctionHandler(ABC):
         """
         Validate function parameters before execution.
         
+        Called before every ``handle``, so implementations should only do
+        cheap checks against tables built once (at import or construction),
+        never re-derive them from the schema per call.
+        
         Args:
             parameters: Function parameters to validate
             
@@ -78,4 +82,24 @@ class IFunctionHandler(ABC):
             }
         """
         pass
-
+    
+    def get_parameters_schema(self) -> Dict[str, Any]:
+        """
+        Get the JSON schema of the function parameters.
+        
+        Returns:
+            The ``parameters`` object of ``get_function_schema()``
+        """
+        return self.get_function_schema()["function"]["parameters"]
+    
+    def is_read_only(self) -> bool:
+        """
+        Whether the function only reads data and has no side effects.
+        
+        Consecutive read-only calls of one assistant turn may run concurrently;
+        every other call runs alone, in call order. The default is False.
+        
+        Returns:
+            True if calls may run concurrently with other read-only calls
+        """
+        return False
@@ -8,7 +8,7 @@ This allows switching between different messaging platforms:
 - etc.
 """
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable, List, Tuple
 
 
 class IMessageProvider(ABC):
@@ -16,6 +16,12 @@ class IMessageProvider(ABC):
     Interface for message providers following Strategy Pattern.
     
     Implementations can be swapped without changing business logic.
+    
+    HTTP-backed implementations must hold one persistent, pooled client
+    (e.g. a ``requests.Session`` with a mounted ``HTTPAdapter``) for their
+    whole lifetime instead of opening a connection per send, with the pool
+    sized for the number of concurrent workers. They are created once by the
+    service container and released through ``close()`` at shutdown.
     """
     
     @abstractmethod
@@ -32,6 +38,62 @@ class IMessageProvider(ABC):
         """
         pass
     
+    def send_text_messages_bulk(
+        self,
+        items: List[Tuple[str, str]]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Send several text messages (e.g. a broadcast).
+        
+        Providers can override this to send concurrently over their pooled
+        connections. The default implementation sends them one by one.
+        
+        Args:
+            items: (recipient, message) pairs
+            
+        Returns:
+            One ``send_text_message`` result per item, in the same order
+        """
+        return [self.send_text_message(recipient, message) for recipient, message in items]
+    
+    def send_text_message_chunked(
+        self,
+        recipient: str,
+        chunks: Iterable[str],
+        min_length: int = 300
+    ) -> bool:
+        """
+        Send streamed text as one or more messages, splitting at paragraph breaks.
+        
+        Text is buffered until it holds at least ``min_length`` characters and a
+        paragraph break, then everything up to the last break is sent, so the
+        first part of a long answer goes out while the rest is still generated.
+        
+        Args:
+            recipient: Recipient identifier (phone number, user ID, etc.)
+            chunks: Text pieces in order (e.g. from ``IAIProvider.stream_response``)
+            min_length: Minimum buffered length before a message is sent early
+            
+        Returns:
+            True if every message was sent, False otherwise
+        """
+        success = True
+        buffer = ""
+        for chunk in chunks:
+            buffer += chunk
+            if len(buffer) < min_length:
+                continue
+            split_at = buffer.rfind("\n\n")
+            if split_at > 0:
+                head, buffer = buffer[:split_at].strip(), buffer[split_at + 2:]
+                if head:
+                    success = self.send_text_message(recipient, head) is not None and success
+        
+        tail = buffer.strip()
+        if tail:
+            success = self.send_text_message(recipient, tail) is not None and success
+        return success
+    
     @abstractmethod
     def send_typing_indicator(self, message_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -45,6 +107,23 @@ class IMessageProvider(ABC):
         """
         pass
     
+    def is_user_message(self, webhook_body: Dict[str, Any]) -> bool:
+        """
+        Cheaply check whether a webhook carries a user message this provider can process.
+        
+        Lets the webhook endpoint acknowledge and drop other events (delivery
+        receipts, unsupported message types) before any queueing. Providers
+        should override this with a few key lookups; the default implementation
+        runs the full ``parse_webhook``.
+        
+        Args:
+            webhook_body: Raw webhook payload from provider
+            
+        Returns:
+            True if ``parse_webhook`` would return a message, False otherwise
+        """
+        return self.parse_webhook(webhook_body) is not None
+    
     @abstractmethod
     def parse_webhook(self, webhook_body: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
@@ -58,4 +137,11 @@ class IMessageProvider(ABC):
             or None if not a valid message
         """
         pass
-
+    
+    def close(self) -> None:
+        """
+        Release pooled connections held by the provider.
+        
+        The default implementation holds nothing and does nothing.
+        """
+        pass
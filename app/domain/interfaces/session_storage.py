@@ -19,6 +19,26 @@ class ISessionStorage(ABC):
         """
         pass
     
+    def get_session_fields(self, session_id: str, *fields: str) -> Optional[Dict[str, Any]]:
+        """
+        Retrieve only some fields of the session data.
+        
+        Storages that can read fields individually should override this; the
+        default loads the whole session.
+        
+        Args:
+            session_id: Unique session identifier
+            *fields: Names of the fields to retrieve
+            
+        Returns:
+            Dictionary with the requested fields (missing ones set to None),
+            or None if the session is not found
+        """
+        session = self.get_session(session_id)
+        if session is None:
+            return None
+        return {field: session.get(field) for field in fields}
+    
     @abstractmethod
     def set_session(self, session_id: str, data: Dict[str, Any], ttl: Optional[int] = None) -> None:
         """
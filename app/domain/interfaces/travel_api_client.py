@@ -16,6 +16,11 @@ class ITravelAPIClient(ABC):
     
     Implementations can be swapped without changing business logic.
     Supports multiple verticals (flights, hotels, etc.).
+    
+    HTTP-backed implementations must reuse one persistent, pooled client
+    (e.g. a keep-alive ``requests.Session``) across calls rather than
+    connecting per request, so concurrent tool calls share warm TLS
+    connections. Connections are released through ``close()`` at shutdown.
     """
     
     @abstractmethod
@@ -96,4 +101,11 @@ class ITravelAPIClient(ABC):
             Exception: If API call fails
         """
         pass
-
+    
+    def close(self) -> None:
+        """
+        Release pooled connections held by the client.
+        
+        The default implementation holds nothing and does nothing.
+        """
+        pass
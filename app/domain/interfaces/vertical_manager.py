@@ -4,7 +4,7 @@ Manages different travel verticals (flights, hotels, etc.)
 and routes function calls to appropriate handlers.
 """
 from abc import ABC, abstractmethod
-from typing import Dict, Optional, List
+from typing import Any, Dict, FrozenSet, Optional, List
 
 from app.domain.interfaces.function_handler import IFunctionHandler
 
@@ -36,6 +36,10 @@ class IVerticalManager(ABC):
         """
         Get handler for a specific function name.
         
+        Called for every tool call, so implementations must resolve it with a
+        dictionary lookup maintained by ``register_handler`` rather than by
+        scanning the registered handlers.
+        
         Args:
             function_name: Name of the function to handle
             
@@ -44,6 +48,19 @@ class IVerticalManager(ABC):
         """
         pass
     
+    @abstractmethod
+    def get_handler_names(self) -> FrozenSet[str]:
+        """
+        Get the names of all registered functions.
+        
+        Use this for membership checks instead of ``get_all_handlers``,
+        which returns a copy of the registry.
+        
+        Returns:
+            Frozen set of registered function names
+        """
+        pass
+    
     @abstractmethod
     def get_all_handlers(self) -> Dict[str, IFunctionHandler]:
         """
@@ -54,6 +71,20 @@ class IVerticalManager(ABC):
         """
         pass
     
+    @abstractmethod
+    def get_openai_tools_payload(self) -> List[Dict[str, Any]]:
+        """
+        Get the ``tools`` payload for the Chat Completions API.
+        
+        Implementations should build it once from the registered handlers'
+        schemas and return the same list until the registry changes. Callers
+        must treat the returned list as read-only.
+        
+        Returns:
+            List of tool definitions in OpenAI format
+        """
+        pass
+    
     @abstractmethod
     def get_handlers_by_vertical(self, vertical: str) -> List[IFunctionHandler]:
         """
@@ -66,4 +97,13 @@ class IVerticalManager(ABC):
             List of handlers for the vertical
         """
         pass
-
+    
+    def freeze(self) -> None:
+        """
+        Signal that handler registration at startup is complete.
+        
+        Implementations may specialize ``get_handler`` for the final registry
+        (e.g. bind it directly to the registry dict's ``get``). The default
+        implementation does nothing.
+        """
+        pass
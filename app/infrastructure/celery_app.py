@@ -6,14 +6,16 @@ from celery import Celery
 from app.config.settings import Config
 
 # Configure logging for Celery to use stdout (Railway marks stderr as errors)
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    stream=sys.stdout,  # Explicitly send to stdout
-    force=True  # Override any existing configuration
-)
-# Redirect stderr to stdout for Celery and its dependencies
-sys.stderr = sys.stdout
+# Only when nothing has configured logging yet (e.g. the worker process); inside
+# the Flask app the factory's logging setup must not be overridden on import
+if not logging.getLogger().handlers:
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        stream=sys.stdout,  # Explicitly send to stdout
+    )
+    # Redirect stderr to stdout for Celery and its dependencies
+    sys.stderr = sys.stdout
 
 
 def create_celery_app(app=None) -> Celery:
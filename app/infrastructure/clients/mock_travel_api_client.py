@@ -1,6 +1,7 @@
 """Mock implementation of travel API client for development/testing."""
+import bisect
 import logging
-import uuid
+import secrets
 from typing import List, Optional
 from datetime import datetime, timedelta
 import random
@@ -12,6 +13,31 @@ from app.domain.entities.flight import Flight, Booking, TravelHistory
 logger = logging.getLogger(__name__)
 
 
+# Sample data used to seed the demo bookings
+DEMO_USER_ID = "demo_user_123"
+SAMPLE_ORIGINS = ("JFK", "LAX", "SFO", "ORD", "MIA")
+SAMPLE_DESTINATIONS = ("LHR", "CDG", "NRT", "DXB", "SYD")
+# (display name, IATA code) pairs, so one pick gives a matching name and code
+SAMPLE_AIRLINES = (
+    ("American Airlines", "AA"),
+    ("United Airlines", "UA"),
+    ("Delta", "DL"),
+    ("British Airways", "BA"),
+    ("Lufthansa", "LH"),
+)
+
+# Airlines offered by mock flight searches
+SEARCH_AIRLINES = SAMPLE_AIRLINES + (("Emirates", "EK"),)
+DEPARTURE_HOURS = tuple(range(6, 23))
+DEPARTURE_MINUTES = (0, 15, 30, 45)
+AVAILABLE_SEATS = tuple(range(5, 51))
+
+
+def _most_recent_first(booking: Booking) -> float:
+    """Sort key that orders bookings by departure time, most recent first."""
+    return -booking.departure_time.timestamp()
+
+
 class MockTravelAPIClient(ITravelAPIClient):
     """
     Mock implementation of travel API client.
@@ -23,23 +49,23 @@ class MockTravelAPIClient(ITravelAPIClient):
     def __init__(self):
         """Initialize mock client with in-memory storage."""
         self._bookings: dict[str, Booking] = {}
-        self._user_bookings: dict[str, List[str]] = {}  # user_id -> [booking_ids]
+        # user_id -> [bookings] (shared objects), kept sorted most recent first
+        self._user_bookings: dict[str, List[Booking]] = {}
         self._logger = logging.getLogger(__name__)
         self._initialize_mock_data()
     
     def _initialize_mock_data(self) -> None:
-        """Initialize with some sample bookings for testing."""
+        """Initialize with some sample bookings for testing (only once)."""
         # Create sample bookings for demo user
-        demo_user_id = "demo_user_123"
-        sample_origins = ["JFK", "LAX", "SFO", "ORD", "MIA"]
-        sample_destinations = ["LHR", "CDG", "NRT", "DXB", "SYD"]
-        airlines = ["American Airlines", "United Airlines", "Delta", "British Airways", "Lufthansa"]
+        demo_user_id = DEMO_USER_ID
+        if demo_user_id in self._user_bookings:
+            return
         
         for i in range(3):
-            booking_id = f"BK{str(uuid.uuid4())[:8].upper()}"
-            flight_id = f"FL{str(uuid.uuid4())[:8].upper()}"
-            origin = random.choice(sample_origins)
-            destination = random.choice(sample_destinations)
+            booking_id = f"BK{secrets.token_hex(4).upper()}"
+            flight_id = f"FL{secrets.token_hex(4).upper()}"
+            origin = random.choice(SAMPLE_ORIGINS)
+            destination = random.choice(SAMPLE_DESTINATIONS)
             
             # Mix of past and future bookings
             if i == 0:
@@ -55,6 +81,7 @@ class MockTravelAPIClient(ITravelAPIClient):
                 arrival = departure + timedelta(hours=8)
                 status = "confirmed"
             
+            airline, code = random.choice(SAMPLE_AIRLINES)
             booking = Booking(
                 booking_id=booking_id,
                 user_id=demo_user_id,
@@ -64,18 +91,18 @@ class MockTravelAPIClient(ITravelAPIClient):
                 departure_time=departure,
                 arrival_time=arrival,
                 passengers=random.randint(1, 3),
-                total_price=round(random.uniform(300, 1500), 2),
+                total_price=random.randrange(30000, 150001) / 100,  # Whole cents
                 currency="USD",
                 status=status,
                 booking_date=departure - timedelta(days=60),
-                airline=random.choice(airlines),
-                flight_number=f"{random.choice(['AA', 'UA', 'DL', 'BA', 'LH'])}{random.randint(100, 9999)}"
+                airline=airline,
+                flight_number=f"{code}{random.randint(100, 9999)}"
             )
             
             self._bookings[booking_id] = booking
-            if demo_user_id not in self._user_bookings:
-                self._user_bookings[demo_user_id] = []
-            self._user_bookings[demo_user_id].append(booking_id)
+            bisect.insort(
+                self._user_bookings.setdefault(demo_user_id, []), booking, key=_most_recent_first
+            )
     
     def search_flights(
         self,
@@ -110,43 +137,43 @@ class MockTravelAPIClient(ITravelAPIClient):
             # Default to tomorrow if parsing fails
             departure_date = datetime.now() + timedelta(days=1)
         
-        # Generate mock flight options
-        airlines = ["American Airlines", "United Airlines", "Delta", "British Airways", "Lufthansa", "Emirates"]
-        flights = []
-        
-        # Generate 3-5 flight options
+        # Generate 3-5 flight options, sampling each field for all options at once
         num_options = random.randint(3, 5)
+        origin = origin.upper()
+        destination = destination.upper()
         
-        for i in range(num_options):
-            # Vary departure times throughout the day
-            departure_time = departure_date.replace(
-                hour=random.randint(6, 22),
-                minute=random.choice([0, 15, 30, 45])
-            )
-            
-            # Flight duration between 2-12 hours
-            duration_hours = random.uniform(2, 12)
-            arrival_time = departure_time + timedelta(hours=duration_hours)
-            
-            # Price varies by time and airline
-            base_price = random.uniform(200, 1200)
-            price_multiplier = 1.0 + (i * 0.1)  # First option is cheapest
-            total_price = round(base_price * price_multiplier * passengers, 2)
-            
-            flight = Flight(
-                flight_id=f"FL{str(uuid.uuid4())[:8].upper()}",
-                origin=origin.upper(),
-                destination=destination.upper(),
+        # Vary departure times throughout the day
+        hours = random.choices(DEPARTURE_HOURS, k=num_options)
+        minutes = random.choices(DEPARTURE_MINUTES, k=num_options)
+        # Flight duration between 2-12 hours
+        durations = [random.uniform(2, 12) for _ in range(num_options)]
+        # Price varies by time and airline (first option is cheapest), in whole cents:
+        # base of 200-1200 scaled by 1.0, 1.1, 1.2... per option and by passengers
+        prices = [
+            random.randrange(20000, 120001) * (10 + i) * passengers // 10 / 100
+            for i in range(num_options)
+        ]
+        airlines = random.choices(SEARCH_AIRLINES, k=num_options)
+        seats = random.choices(AVAILABLE_SEATS, k=num_options)
+        
+        flights = []
+        for hour, minute, duration_hours, price, (airline, code), available in zip(
+            hours, minutes, durations, prices, airlines, seats
+        ):
+            departure_time = departure_date.replace(hour=hour, minute=minute)
+            flights.append(Flight(
+                flight_id=f"FL{secrets.token_hex(4).upper()}",
+                origin=origin,
+                destination=destination,
                 departure_time=departure_time,
-                arrival_time=arrival_time,
-                airline=random.choice(airlines),
-                price=total_price,
+                arrival_time=departure_time + timedelta(hours=duration_hours),
+                airline=airline,
+                price=price,
                 currency="USD",
-                available_seats=random.randint(5, 50),
-                flight_number=f"{random.choice(['AA', 'UA', 'DL', 'BA', 'LH', 'EK'])}{random.randint(100, 9999)}",
+                available_seats=available,
+                flight_number=f"{code}{random.randint(100, 9999)}",
                 duration_minutes=int(duration_hours * 60)
-            )
-            flights.append(flight)
+            ))
         
         # Sort by price (cheapest first)
         flights.sort(key=lambda f: f.price)
@@ -230,11 +257,8 @@ class MockTravelAPIClient(ITravelAPIClient):
         """
         self._logger.info(f"Mock: Retrieving travel history for user {user_id}")
         
-        booking_ids = self._user_bookings.get(user_id, [])
-        bookings = [self._bookings[bid] for bid in booking_ids if bid in self._bookings]
-        
-        # Sort by departure time (most recent first)
-        bookings.sort(key=lambda b: b.departure_time, reverse=True)
+        # Already sorted by departure time (most recent first) on insertion
+        bookings = list(self._user_bookings.get(user_id, ()))
         
         return TravelHistory(user_id=user_id, bookings=bookings)
     
@@ -269,7 +293,7 @@ class MockTravelAPIClient(ITravelAPIClient):
         Returns:
             Created booking
         """
-        booking_id = f"BK{str(uuid.uuid4())[:8].upper()}"
+        booking_id = f"BK{secrets.token_hex(4).upper()}"
         
         booking = Booking(
             booking_id=booking_id,
@@ -289,9 +313,7 @@ class MockTravelAPIClient(ITravelAPIClient):
         )
         
         self._bookings[booking_id] = booking
-        if user_id not in self._user_bookings:
-            self._user_bookings[user_id] = []
-        self._user_bookings[user_id].append(booking_id)
+        bisect.insort(self._user_bookings.setdefault(user_id, []), booking, key=_most_recent_first)
         
         return booking
 
@@ -1,16 +1,108 @@
 """Starlings API client for making authenticated requests."""
+import copy
 import logging
+import threading
+import time
 import requests
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Hashable, Iterator, List, Tuple
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
 from app.config.settings import Config
+from app.utils import fastjson
 
 
 logger = logging.getLogger(__name__)
 
 
+# Sort keys for the list axes of an availability payload whose order does not
+# change the search (legs are ordered chronologically anyway)
+_AVAILABILITY_SORT_KEYS = {
+    "legs": lambda leg: (
+        str(leg.get("FlightDate", "")),
+        str(leg.get("DepartureAirportCity", "")),
+        str(leg.get("ArrivalAirportCity", "")),
+    ),
+    "passengers": lambda group: (str(group.get("Type", "")), str(group.get("Count", ""))),
+    "feathers_passengers": lambda passenger: (
+        str(passenger.get("user_id", "")),
+        str(passenger.get("cost_center_id", "")),
+    ),
+    "cabin_classes": str,
+}
+
+
+def _canonicalize_payload(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Return a copy of an availability payload with its list axes sorted.
+    
+    Used only to build the cache key, so equivalent searches given in a
+    different order share an entry. The payload sent to the API is untouched.
+    
+    Args:
+        payload: Flight search payload
+        
+    Returns:
+        Shallow copy of the payload with ``legs``, ``passengers``,
+        ``feathers_passengers`` and ``cabin_classes`` sorted
+    """
+    canonical = dict(payload)
+    for field, sort_key in _AVAILABILITY_SORT_KEYS.items():
+        items = canonical.get(field)
+        if isinstance(items, list) and len(items) > 1:
+            canonical[field] = sorted(items, key=sort_key)
+    return canonical
+
+
+class _ResponseCache:
+    """
+    Small thread-safe TTL cache for successful API responses.
+    
+    Responses are deep-copied on the way in and out, so callers can modify
+    what they get back. When full, expired entries are dropped first, then
+    the oldest ones. A ``ttl`` of 0 disables the cache.
+    """
+    
+    def __init__(self, ttl: float, maxsize: int):
+        """
+        Initialize the cache.
+        
+        Args:
+            ttl: Seconds an entry stays valid
+            maxsize: Maximum number of entries
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: Dict[Hashable, Tuple[float, Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+    
+    def get(self, key: Hashable) -> Optional[Dict[str, Any]]:
+        """Return a copy of an unexpired response, if any."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() >= entry[0]:
+                del self._entries[key]
+                return None
+            response = entry[1]
+        return copy.deepcopy(response)
+    
+    def put(self, key: Hashable, response: Dict[str, Any]) -> None:
+        """Store a copy of a successful response."""
+        if self.ttl <= 0:
+            return
+        response = copy.deepcopy(response)
+        now = time.monotonic()
+        with self._lock:
+            if len(self._entries) >= self.maxsize:
+                for stale in [k for k, (expires, _) in self._entries.items() if expires <= now]:
+                    del self._entries[stale]
+                while len(self._entries) >= self.maxsize:
+                    del self._entries[next(iter(self._entries))]
+            self._entries[key] = (now + self.ttl, response)
+
+
 class StarlingsAPIClient:
     """
     Client for interacting with Starlings Travel API.
@@ -18,29 +110,88 @@ class StarlingsAPIClient:
     Handles authentication, token management, and API requests.
     """
     
-    def __init__(self, base_url: Optional[str] = None, api_key: Optional[str] = None):
+    _shared: Optional["StarlingsAPIClient"] = None
+    _shared_lock = threading.Lock()
+    
+    # Connections kept open to the API host (shared by all worker threads)
+    POOL_MAXSIZE = 32
+    
+    # Successful availability searches are reused for identical payloads
+    SEARCH_CACHE_TTL = 600.0
+    SEARCH_CACHE_MAXSIZE = 512
+    
+    @classmethod
+    def get_shared(cls) -> "StarlingsAPIClient":
+        """
+        Get the process-wide client (singleton pattern).
+        
+        All default-configured callers share one keep-alive session, so the
+        calls of an authentication flow and later searches reuse the same
+        TCP/TLS connections to the API host.
+        
+        Returns:
+            Shared StarlingsAPIClient instance
+        """
+        if cls._shared is None:
+            with cls._shared_lock:
+                if cls._shared is None:
+                    cls._shared = cls()
+        return cls._shared
+    
+    @classmethod
+    def close_shared(cls) -> None:
+        """Close and drop the process-wide client, if one was created."""
+        with cls._shared_lock:
+            shared, cls._shared = cls._shared, None
+        if shared is not None:
+            shared.close()
+    
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        api_key: Optional[str] = None,
+        search_cache_ttl: Optional[float] = None
+    ):
         """
         Initialize the Starlings API client.
         
         Args:
             base_url: Base URL for Starlings API (defaults to Config value)
             api_key: API key for authentication (defaults to Config value)
+            search_cache_ttl: Seconds an availability result is reused (defaults
+                to 10 minutes, 0 disables the cache)
         """
         self.base_url = base_url or Config.STARLINGS_API_BASE_URL
         self.api_key = api_key or Config.STARLINGS_API_KEY
         self._logger = logging.getLogger(__name__)
         
-        # Create session with retry strategy
+        self._search_cache = _ResponseCache(
+            self.SEARCH_CACHE_TTL if search_cache_ttl is None else search_cache_ttl,
+            self.SEARCH_CACHE_MAXSIZE
+        )
+        
+        # Create keep-alive session with retry strategy and a pool sized for
+        # concurrent callers; every request inherits the default headers
         self.session = requests.Session()
+        self.session.headers.update({"Accept": "application/json"})
         retry_strategy = Retry(
             total=3,
             backoff_factor=1,
             status_forcelist=[429, 500, 502, 503, 504],
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=self.POOL_MAXSIZE,
+            pool_maxsize=self.POOL_MAXSIZE,
+            pool_block=False
+        )
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
     
+    def close(self) -> None:
+        """Close the underlying HTTP session and its pooled connections."""
+        self.session.close()
+    
     def _make_request(
         self,
         method: str,
@@ -72,14 +223,9 @@ class StarlingsAPIClient:
         base_url = self.base_url.rstrip('/')
         endpoint = endpoint.lstrip('/')
         url = f"{base_url}/{endpoint}"
+        # Accept comes from the session headers and requests sets Content-Type for json bodies
         headers = headers or {}
         
-        # Add default headers if not already present
-        if "Accept" not in headers:
-            headers["Accept"] = "application/json"
-        if "Content-Type" not in headers and json_data is not None:
-            headers["Content-Type"] = "application/json"
-        
         try:
             # Use provided timeout or default to 30 seconds
             request_timeout = timeout if timeout is not None else 30
@@ -93,38 +239,38 @@ class StarlingsAPIClient:
                 **kwargs
             )
             
-            # Log request details for debugging
-            self._logger.debug(f"Request: {method} {url}")
-            self._logger.debug(f"Headers: {headers}")
-            self._logger.debug(f"Params: {params}")
-            if json_data:
-                import json
-                try:
-                    self._logger.debug(f"JSON Payload: {json.dumps(json_data, indent=2, default=str)}")
-                except Exception:
-                    self._logger.debug(f"JSON Payload: {json_data}")
-            self._logger.debug(f"Status Code: {response.status_code}")
+            # Log request details for debugging (skipped entirely unless DEBUG is on)
+            if self._logger.isEnabledFor(logging.DEBUG):
+                self._logger.debug(f"Request: {method} {url}")
+                self._logger.debug(f"Headers: {headers}")
+                self._logger.debug(f"Params: {params}")
+                if json_data:
+                    try:
+                        self._logger.debug(f"JSON Payload: {fastjson.dumps_pretty(json_data)}")
+                    except Exception:
+                        self._logger.debug(f"JSON Payload: {json_data}")
+                self._logger.debug(f"Status Code: {response.status_code}")
             
             # Check status code
             response.raise_for_status()
             
             # Check if response has content
-            if not response.text:
+            if not response.content:
                 self._logger.error(f"Empty response from {method} {url}")
                 raise requests.exceptions.RequestException(
                     f"Empty response from {url} (status {response.status_code})"
                 )
             
-            # Try to parse JSON
+            # Try to parse JSON (straight from the raw bytes, no charset detection)
             try:
-                response_data = response.json()
+                response_data = fastjson.loads(response.content)
                 return response_data
             except ValueError as json_error:
                 # Response is not JSON - log the actual content
                 self._logger.error(f"Non-JSON response from {method} {url}")
                 self._logger.error(f"Response status: {response.status_code}")
-                self._logger.error(f"Response headers: {dict(response.headers)}")
-                self._logger.error(f"Response text (first 500 chars): {response.text[:500]}")
+                self._logger.error("Response headers: %s", response.headers)
+                self._logger.error("Response text (first 500 chars): %s", response.text[:500])
                 raise requests.exceptions.RequestException(
                     f"Expected JSON response but got: {response.text[:200]}"
                 ) from json_error
@@ -133,8 +279,8 @@ class StarlingsAPIClient:
             # HTTP error (4xx, 5xx)
             self._logger.error(f"HTTP error {e.response.status_code}: {method} {url}")
             if e.response is not None:
-                self._logger.error(f"Response text: {e.response.text[:500]}")
-                self._logger.error(f"Response headers: {dict(e.response.headers)}")
+                self._logger.error("Response text: %s", e.response.text[:500])
+                self._logger.error("Response headers: %s", e.response.headers)
             raise
         except requests.exceptions.RequestException as e:
             # Other request errors (connection, timeout, etc.)
@@ -285,6 +431,53 @@ class StarlingsAPIClient:
         self._logger.info("Users information retrieved")
         return response
     
+    def get_users_paginated(
+        self,
+        company_id: int,
+        access_token: str,
+        tenant: str,
+        per_page: int = 500,
+        with_roles: bool = False,
+        only_active: bool = True
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Iterate over the users of a company one page at a time.
+        
+        Stops after the first short page, so small companies are fetched in a
+        single request instead of asking the API for one oversized page.
+        
+        Args:
+            company_id: Company identifier
+            access_token: Current access token
+            tenant: Tenant identifier
+            per_page: Items per page (default: 500)
+            with_roles: Include roles in response (default: False)
+            only_active: Only return active users (default: True)
+            
+        Yields:
+            The data array of each page
+            
+        Raises:
+            requests.RequestException: If request fails
+        """
+        page = 1
+        while True:
+            response = self.get_users(
+                company_id=company_id,
+                access_token=access_token,
+                tenant=tenant,
+                page=page,
+                per_page=per_page,
+                with_roles=with_roles,
+                only_active=only_active
+            )
+            data = response.get("data") or []
+            if data:
+                yield data
+            if len(data) < per_page:
+                return
+            page += 1
+    
     def request(
         self,
         method: str,
@@ -329,6 +522,8 @@ class StarlingsAPIClient:
         Search for flight availability.
         
         Note: This endpoint can take longer than usual, so we use a longer timeout.
+        Successful responses are cached per tenant and payload for
+        ``search_cache_ttl`` seconds; failures are never cached.
         
         Args:
             payload: Flight search payload with passengers, legs, cabin_classes, feathers_passengers
@@ -347,24 +542,33 @@ class StarlingsAPIClient:
         endpoint = "/api/travel/flight/availability"
         headers = {
             "Tenant": tenant,
-            "Authorization": f"Bearer {access_token}",
-            "Accept": "application/json",
-            "Content-Type": "application/json"
+            "Authorization": f"Bearer {access_token}"
         }
         
         # Build full URL for logging
         base_url = self.base_url.rstrip('/')
         url = f"{base_url}/{endpoint.lstrip('/')}"
         
-        # Create a hash of the payload for logging/debugging
+        # Hash the payload for the result cache and for logging/debugging
+        cache_key = None
         try:
-            payload_json = json.dumps(payload, indent=2, default=str, sort_keys=True)
-            payload_hash = hashlib.md5(payload_json.encode()).hexdigest()[:8]
-            self._logger.info(f"Starting flight availability search (payload hash: {payload_hash})")
+            payload_json = json.dumps(_canonicalize_payload(payload), default=str, sort_keys=True)
+            payload_digest = hashlib.md5(payload_json.encode()).hexdigest()
+            payload_hash = payload_digest[:8]
+            if self._search_cache.ttl > 0:
+                cache_key = (tenant, payload_digest)
         except Exception as e:
             self._logger.warning(f"Could not serialize payload to JSON: {e}")
             payload_hash = "unknown"
         
+        if cache_key is not None:
+            cached = self._search_cache.get(cache_key)
+            if cached is not None:
+                self._logger.info(f"Flight availability served from cache (payload hash: {payload_hash})")
+                return cached
+        
+        self._logger.info(f"Starting flight availability search (payload hash: {payload_hash})")
+        
         # Use longer timeout for availability searches (60 seconds instead of 30)
         # This endpoint can take longer to process
         try:
@@ -376,6 +580,8 @@ class StarlingsAPIClient:
                 timeout=60  # Longer timeout for availability searches
             )
             self._logger.info(f"Flight availability search completed successfully (payload hash: {payload_hash})")
+            if cache_key is not None:
+                self._search_cache.put(cache_key, response)
             return response
         except requests.Timeout:
             self._logger.error(f"Flight availability search timed out after 60s (payload hash: {payload_hash})")
@@ -383,4 +589,3 @@ class StarlingsAPIClient:
         except Exception as e:
             self._logger.error(f"Flight availability search failed (payload hash: {payload_hash}): {e}")
             raise
-
@@ -2,9 +2,10 @@
 
 Dependency injection container and service locator patterns.
 """
-from app.infrastructure.di.service_container import ServiceContainer
+from app.infrastructure.di.service_container import ServiceContainer, get_service_container
 
 __all__ = [
     "ServiceContainer",
+    "get_service_container",
 ]
 
@@ -1,4 +1,5 @@
 """Service container for dependency injection (IoC Container Pattern)."""
+import atexit
 import logging
 from typing import Optional
 import os
@@ -13,6 +14,7 @@ from app.application.services.conversation_service import ConversationService
 from app.infrastructure.factories.provider_factory import ProviderFactory
 from app.infrastructure.managers.vertical_manager import VerticalManager
 from app.infrastructure.factories.flights_factory import FlightsVerticalFactory
+from app.infrastructure.clients.starlings_api_client import StarlingsAPIClient
 
 
 class ServiceContainer:
@@ -94,6 +96,7 @@ class ServiceContainer:
             # HotelsVerticalFactory.initialize_vertical(self._vertical_manager)
             # TransfersVerticalFactory.initialize_vertical(self._vertical_manager)
             
+            self._vertical_manager.freeze()
             self._verticals_initialized = True
             self._logger.info("All verticals initialized")
         except Exception as e:
@@ -200,6 +203,15 @@ class ServiceContainer:
         use_case = self.get_process_message_use_case()
         return MessageHandler(use_case)
     
+    def close(self) -> None:
+        """Close the HTTP clients created by the container (called at exit)."""
+        if self._message_provider is not None:
+            try:
+                self._message_provider.close()
+            except Exception as e:
+                self._logger.warning(f"Failed to close MessageProvider: {e}")
+        StarlingsAPIClient.close_shared()
+    
     @classmethod
     def reset(cls) -> None:
         """Reset all service instances (useful for testing)."""
@@ -213,3 +225,28 @@ class ServiceContainer:
         cls._process_message_use_case = None
         cls._verticals_initialized = False
 
+
+def get_service_container() -> ServiceContainer:
+    """
+    Get the process-wide service container.
+    
+    Constructs the container on first use only; later calls return the
+    existing instance without re-running ``__init__``.
+    
+    Returns:
+        Shared ServiceContainer instance
+    """
+    container = ServiceContainer._instance
+    if container is None:
+        container = ServiceContainer()
+    return container
+
+
+def _close_service_container() -> None:
+    """Release the current container's pooled HTTP connections (registered once at exit)."""
+    container = ServiceContainer._instance
+    if container is not None:
+        container.close()
+
+
+atexit.register(_close_service_container)
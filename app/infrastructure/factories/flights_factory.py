@@ -6,6 +6,8 @@ This factory sets up all components needed for the flights vertical:
 - Registration with vertical manager
 """
 import logging
+import threading
+from typing import Optional
 
 from app.domain.interfaces.travel_api_client import ITravelAPIClient
 from app.domain.interfaces.vertical_manager import IVerticalManager
@@ -29,20 +31,28 @@ class FlightsVerticalFactory:
     Makes it easy to add new verticals in the future.
     """
     
-    @staticmethod
-    def create_api_client() -> ITravelAPIClient:
+    _api_client: Optional[ITravelAPIClient] = None
+    _api_client_lock = threading.Lock()
+    
+    @classmethod
+    def create_api_client(cls) -> ITravelAPIClient:
         """
         Create travel API client for flights.
         
         Currently returns mock client. In production, this would
-        return a real API client implementation.
+        return a real API client implementation. The client is built once
+        per process and reused by later calls.
         
         Returns:
             ITravelAPIClient instance
         """
-        # TODO: Replace with real API client when available
-        # For now, use mock client
-        return MockTravelAPIClient()
+        if cls._api_client is None:
+            with cls._api_client_lock:
+                if cls._api_client is None:
+                    # TODO: Replace with real API client when available
+                    # For now, use mock client
+                    cls._api_client = MockTravelAPIClient()
+        return cls._api_client
     
     @staticmethod
     def initialize_vertical(vertical_manager: IVerticalManager) -> None:
@@ -8,6 +8,10 @@ from app.domain.interfaces.travel_api_client import ITravelAPIClient
 
 logger = logging.getLogger(__name__)
 
+# String values accepted for the confirmation flag
+_CONFIRMATION_STRINGS = frozenset({"true", "false", "yes", "no", "1", "0"})
+_CONFIRMATION_TRUE_STRINGS = frozenset({"true", "yes", "1"})
+
 
 class CancelBookingHandler(IFunctionHandler):
     """
@@ -87,7 +91,7 @@ class CancelBookingHandler(IFunctionHandler):
             # Try to convert string to boolean
             if isinstance(confirmation, str):
                 confirmation_lower = confirmation.lower()
-                if confirmation_lower not in ["true", "false", "yes", "no", "1", "0"]:
+                if confirmation_lower not in _CONFIRMATION_STRINGS:
                     self._logger.warning(f"Invalid confirmation value: {confirmation}")
                     return False
             else:
@@ -126,7 +130,7 @@ class CancelBookingHandler(IFunctionHandler):
         # Convert string confirmation to boolean if needed
         if isinstance(confirmation, str):
             confirmation_lower = confirmation.lower()
-            confirmation = confirmation_lower in ["true", "yes", "1"]
+            confirmation = confirmation_lower in _CONFIRMATION_TRUE_STRINGS
         
         if not confirmation:
             return {
@@ -21,6 +21,10 @@ _search_cache: Dict[tuple, tuple] = {}
 _cache_lock = Lock()
 _cache_ttl = 30  # Cache for 30 seconds to prevent duplicate requests
 
+# Parameter validation tables (built once, checked on every tool call)
+_REQUIRED_PARAMETERS = ("flight_type", "origin", "destination", "departure_date")
+_FLIGHT_TYPES = frozenset({"one-way", "round-trip"})
+
 
 class SearchFlightsHandler(IFunctionHandler):
     """
@@ -43,6 +47,10 @@ class SearchFlightsHandler(IFunctionHandler):
         """Get the name of the function this handler processes."""
         return "search_flights"
     
+    def is_read_only(self) -> bool:
+        """Flight searches only query availability, so they can run concurrently."""
+        return True
+    
     def get_function_schema(self) -> Dict[str, Any]:
         """
         Get OpenAI function schema for search_flights.
@@ -110,15 +118,13 @@ class SearchFlightsHandler(IFunctionHandler):
         Returns:
             True if parameters are valid, False otherwise
         """
-        required = ["flight_type", "origin", "destination", "departure_date"]
-        
-        for param in required:
+        for param in _REQUIRED_PARAMETERS:
             if param not in parameters:
                 self._logger.warning(f"Missing required parameter: {param}")
                 return False
         
         # Validate flight_type
-        if parameters.get("flight_type") not in ["one-way", "round-trip"]:
+        if parameters.get("flight_type") not in _FLIGHT_TYPES:
             self._logger.warning("flight_type must be 'one-way' or 'round-trip'")
             return False
         
@@ -4,7 +4,7 @@ Manages different travel verticals and routes function calls
 to appropriate handlers.
 """
 import logging
-from typing import Dict, Optional, List
+from typing import Any, Dict, FrozenSet, Optional, List
 
 from app.domain.interfaces.vertical_manager import IVerticalManager
 from app.domain.interfaces.function_handler import IFunctionHandler
@@ -25,6 +25,8 @@ class VerticalManager(IVerticalManager):
         """Initialize vertical manager with empty registry."""
         self._handlers: Dict[str, IFunctionHandler] = {}
         self._vertical_handlers: Dict[str, List[IFunctionHandler]] = {}
+        self._handler_names: FrozenSet[str] = frozenset()
+        self._tools_payload: Optional[List[Dict[str, Any]]] = None
         self._logger = logging.getLogger(__name__)
     
     def register_handler(self, handler: IFunctionHandler, vertical: str) -> None:
@@ -53,6 +55,8 @@ class VerticalManager(IVerticalManager):
             )
         
         self._handlers[function_name] = handler
+        self._handler_names = frozenset(self._handlers)
+        self._tools_payload = None
         
         # Track by vertical
         if vertical not in self._vertical_handlers:
@@ -76,6 +80,25 @@ class VerticalManager(IVerticalManager):
         """
         return self._handlers.get(function_name)
     
+    def freeze(self) -> None:
+        """
+        Bind ``get_handler`` straight to the registry dict's ``get``.
+        
+        Tool-call routing then skips the Python-level method call. The dict is
+        updated in place, so handlers registered later are still found.
+        """
+        self.get_handler = self._handlers.get
+        self.get_openai_tools_payload()
+    
+    def get_handler_names(self) -> FrozenSet[str]:
+        """
+        Get the names of all registered functions.
+        
+        Returns:
+            Frozen set of registered function names (rebuilt only on registration)
+        """
+        return self._handler_names
+    
     def get_all_handlers(self) -> Dict[str, IFunctionHandler]:
         """
         Get all registered handlers.
@@ -85,6 +108,30 @@ class VerticalManager(IVerticalManager):
         """
         return self._handlers.copy()
     
+    def get_openai_tools_payload(self) -> List[Dict[str, Any]]:
+        """
+        Get the ``tools`` payload for the Chat Completions API.
+        
+        Built from the handlers' schemas on first use (or at ``freeze()``) and
+        returned by reference until another handler is registered.
+        
+        Returns:
+            List of tool definitions in OpenAI format (do not modify)
+        """
+        if self._tools_payload is None:
+            tools = []
+            for function_name, handler in self._handlers.items():
+                try:
+                    tools.append(handler.get_function_schema())
+                except Exception as e:
+                    # Skip broken schemas so the other tools stay available
+                    self._logger.error(
+                        f"Failed to get schema from handler {function_name}: {e}",
+                        exc_info=True
+                    )
+            self._tools_payload = tools
+        return self._tools_payload
+    
     def get_handlers_by_vertical(self, vertical: str) -> List[IFunctionHandler]:
         """
         Get all handlers for a specific vertical.
@@ -1,7 +1,7 @@
 """OpenAI provider implementation using Chat Completions API (Strategy Pattern)."""
 import os
-import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Any, List, Dict
 from datetime import datetime, timedelta
 from openai import OpenAI
@@ -10,6 +10,7 @@ from dotenv import load_dotenv
 from app.domain.interfaces.ai_provider import IAIProvider
 from app.domain.interfaces.conversation_repository import IConversationRepository
 from app.domain.interfaces.vertical_manager import IVerticalManager
+from app.utils import fastjson
 
 
 class OpenAIProvider(IAIProvider):
@@ -109,28 +110,16 @@ class OpenAIProvider(IAIProvider):
         Raises:
             Exception: If AI service call fails
         """
-        # Get or initialize conversation
-        messages = self.conversation_repository.get_conversation(user_id)
+        # Get the recent conversation window (reading it also extends its TTL).
+        # The stored history is a sliding window, so the system prompt is always
+        # added here.
+        stored = self.conversation_repository.get_conversation_and_touch(
+            user_id, last_n=self._max_context_messages
+        ) or []
+        messages = self._build_context(stored)
         
-        if messages is None:
-            # Initialize new conversation with system prompt
-            messages = [
-                {
-                    "role": "system",
-                    "content": self.system_prompt
-                }
-            ]
-            self.conversation_repository.save_conversation(user_id, messages)
-        else:
-            # Check if conversation is too old (older than 1 hour)
-            # This is handled by Redis TTL, but we can also check message count
-            # Clear old messages if conversation is too long
-            if len(messages) > self._max_context_messages:
-                self.conversation_repository.clear_old_messages(
-                    user_id,
-                    keep_last_n=self._max_context_messages
-                )
-                messages = self.conversation_repository.get_conversation(user_id) or messages
+        # Messages up to here are already stored; later ones are appended in batches
+        persisted = len(messages)
         
         # Add user message
         messages.append({
@@ -138,9 +127,6 @@ class OpenAIProvider(IAIProvider):
             "content": message_body
         })
         
-        # Extend TTL when conversation is used
-        self.conversation_repository.extend_ttl(user_id)
-        
         # Build tools definition from vertical manager
         tools = self._build_tools_definition()
         
@@ -190,9 +176,12 @@ class OpenAIProvider(IAIProvider):
                         for tc in assistant_message.tool_calls
                     ]
                     
-                    # Save assistant message with tool calls
+                    # Save the user/tool messages so far and the assistant message with tool calls
                     messages.append(assistant_msg_dict)
-                    self.conversation_repository.save_conversation(user_id, messages)
+                    self.conversation_repository.add_messages(
+                        user_id, messages[persisted:], max_len=self._max_context_messages
+                    )
+                    persisted = len(messages)
                     
                     # Execute function calls
                     tool_messages = self._handle_function_calls(
@@ -209,7 +198,9 @@ class OpenAIProvider(IAIProvider):
                 
                 # No tool calls - we have the final response
                 messages.append(assistant_msg_dict)
-                self.conversation_repository.save_conversation(user_id, messages)
+                self.conversation_repository.add_messages(
+                    user_id, messages[persisted:], max_len=self._max_context_messages
+                )
                 
                 # Return the response
                 return assistant_message.content or "I apologize, but I couldn't generate a response."
@@ -218,12 +209,33 @@ class OpenAIProvider(IAIProvider):
                 self._logger.error(f"Error in Chat Completions API call: {e}", exc_info=True)
                 raise
     
+    def _build_context(self, stored: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Build the messages sent to the model from the stored history.
+        
+        Args:
+            stored: Stored conversation messages (may include a system message)
+            
+        Returns:
+            System prompt followed by the most recent history messages
+        """
+        history = [msg for msg in stored if msg.get("role") != "system"]
+        history = history[-self._max_context_messages:]
+        
+        # A trimmed window can start with tool results whose assistant call was dropped
+        start = 0
+        while start < len(history) and history[start].get("role") == "tool":
+            start += 1
+        
+        return [{"role": "system", "content": self.system_prompt}] + history[start:]
+    
     def _build_tools_definition(self) -> Optional[List[Dict[str, Any]]]:
         """
-        Build tools definition from handlers for Chat Completions API.
+        Get tools definition from handlers for Chat Completions API.
         
         Each handler provides its own schema, eliminating the need for
-        hardcoded schemas in the provider.
+        hardcoded schemas in the provider. The vertical manager builds the
+        list once and it is passed to the API as-is (never copied or mutated).
         
         Returns:
             List of tool definitions in OpenAI format, or None if no handlers
@@ -231,28 +243,7 @@ class OpenAIProvider(IAIProvider):
         if not self.vertical_manager:
             return None
         
-        handlers = self.vertical_manager.get_all_handlers()
-        if not handlers:
-            return None
-        
-        tools = []
-        
-        # Get schemas directly from handlers
-        for handler in handlers.values():
-            try:
-                schema = handler.get_function_schema()
-                tools.append(schema)
-                self._logger.debug(
-                    f"Added schema for function: {handler.get_function_name()}"
-                )
-            except Exception as e:
-                self._logger.error(
-                    f"Failed to get schema from handler {handler.get_function_name()}: {e}",
-                    exc_info=True
-                )
-                # Continue with other handlers even if one fails
-        
-        return tools if tools else None
+        return self.vertical_manager.get_openai_tools_payload() or None
     
     def _handle_function_calls(
         self,
@@ -273,75 +264,115 @@ class OpenAIProvider(IAIProvider):
             self._logger.error("Function call received but no vertical manager configured")
             return []
         
-        tool_messages = []
+        if len(tool_calls) == 1:
+            return [self._handle_function_call(tool_calls[0], user_id)]
         
+        # Runs of consecutive read-only calls (e.g. searches for several dates)
+        # execute concurrently; any other call (e.g. a cancellation) runs alone,
+        # so reads and writes keep their call order. Results keep the call order.
+        results: List[Dict[str, Any]] = []
+        read_only_run: List[Any] = []
         for tool_call in tool_calls:
-            function_name = tool_call.function.name
-            function_args = tool_call.function.arguments
+            handler = self.vertical_manager.get_handler(tool_call.function.name)
+            if handler is not None and handler.is_read_only():
+                read_only_run.append(tool_call)
+                continue
+            results.extend(self._handle_concurrently(read_only_run, user_id))
+            read_only_run = []
+            results.append(self._handle_function_call(tool_call, user_id))
+        results.extend(self._handle_concurrently(read_only_run, user_id))
+        return results
+    
+    def _handle_concurrently(self, tool_calls: List[Any], user_id: str) -> List[Dict[str, Any]]:
+        """
+        Execute read-only function calls concurrently.
+        
+        Args:
+            tool_calls: Tool call objects whose handlers are read-only
+            user_id: User ID for function call context
             
-            self._logger.info(f"Handling function call: {function_name} with args: {function_args}")
+        Returns:
+            Tool message dictionaries, in the same order as the calls
+        """
+        if len(tool_calls) <= 1:
+            return [self._handle_function_call(tool_call, user_id) for tool_call in tool_calls]
+        
+        with ThreadPoolExecutor(max_workers=min(len(tool_calls), 4), thread_name_prefix="tool-call") as executor:
+            return list(executor.map(lambda tool_call: self._handle_function_call(tool_call, user_id), tool_calls))
+    
+    def _handle_function_call(self, tool_call: Any, user_id: str) -> Dict[str, Any]:
+        """
+        Execute a single function call from the assistant.
+        
+        Args:
+            tool_call: Tool call object from OpenAI
+            user_id: User ID for function call context
             
-            # Get handler for this function
-            handler = self.vertical_manager.get_handler(function_name)
+        Returns:
+            Tool message dictionary to add to conversation
+        """
+        function_name = tool_call.function.name
+        function_args = tool_call.function.arguments
+        
+        self._logger.info(f"Handling function call: {function_name} with args: {function_args}")
+        
+        # Get handler for this function
+        handler = self.vertical_manager.get_handler(function_name)
+        
+        if not handler:
+            self._logger.error(f"No handler found for function: {function_name}")
+            return {
+                "role": "tool",
+                "tool_call_id": tool_call.id,
+                "name": function_name,
+                "content": fastjson.dumps({
+                    "success": False,
+                    "error": f"Function {function_name} not supported"
+                }).decode("utf-8")
+            }
+        
+        # Parse function arguments
+        try:
+            if isinstance(function_args, str):
+                parameters = fastjson.loads(function_args)
+            else:
+                parameters = function_args
+        except fastjson.JSONDecodeError as e:
+            self._logger.error(f"Failed to parse function arguments: {e}")
+            return {
+                "role": "tool",
+                "tool_call_id": tool_call.id,
+                "name": function_name,
+                "content": fastjson.dumps({
+                    "success": False,
+                    "error": f"Invalid function arguments: {str(e)}"
+                }).decode("utf-8")
+            }
+        
+        # Execute handler
+        try:
+            result = handler.handle(parameters, user_id=user_id)
             
-            if not handler:
-                self._logger.error(f"No handler found for function: {function_name}")
-                tool_messages.append({
-                    "role": "tool",
-                    "tool_call_id": tool_call.id,
-                    "name": function_name,
-                    "content": json.dumps({
-                        "success": False,
-                        "error": f"Function {function_name} not supported"
-                    })
-                })
-                continue
+            # Convert result to JSON string
+            result_json = fastjson.dumps(result).decode("utf-8")
             
-            # Parse function arguments
-            try:
-                if isinstance(function_args, str):
-                    parameters = json.loads(function_args)
-                else:
-                    parameters = function_args
-            except json.JSONDecodeError as e:
-                self._logger.error(f"Failed to parse function arguments: {e}")
-                tool_messages.append({
-                    "role": "tool",
-                    "tool_call_id": tool_call.id,
-                    "name": function_name,
-                    "content": json.dumps({
-                        "success": False,
-                        "error": f"Invalid function arguments: {str(e)}"
-                    })
-                })
-                continue
+            self._logger.info(f"Function {function_name} executed successfully")
             
-            # Execute handler
-            try:
-                result = handler.handle(parameters, user_id=user_id)
-                
-                # Convert result to JSON string
-                result_json = json.dumps(result)
-                
-                tool_messages.append({
-                    "role": "tool",
-                    "tool_call_id": tool_call.id,
-                    "name": function_name,
-                    "content": result_json
-                })
-                
-                self._logger.info(f"Function {function_name} executed successfully")
-                
-            except Exception as e:
-                self._logger.error(f"Error executing function {function_name}: {e}", exc_info=True)
-                tool_messages.append({
-                    "role": "tool",
-                    "tool_call_id": tool_call.id,
-                    "name": function_name,
-                    "content": json.dumps({
-                        "success": False,
-                        "error": f"Function execution failed: {str(e)}"
-                    })
-                })
-        
-        return tool_messages
+            return {
+                "role": "tool",
+                "tool_call_id": tool_call.id,
+                "name": function_name,
+                "content": result_json
+            }
+            
+        except Exception as e:
+            self._logger.error(f"Error executing function {function_name}: {e}", exc_info=True)
+            return {
+                "role": "tool",
+                "tool_call_id": tool_call.id,
+                "name": function_name,
+                "content": fastjson.dumps({
+                    "success": False,
+                    "error": f"Function execution failed: {str(e)}"
+                }).decode("utf-8")
+            }
@@ -1,6 +1,7 @@
 """WhatsApp provider implementation (Strategy Pattern)."""
 import logging
-from typing import Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Tuple
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
@@ -8,6 +9,7 @@ from urllib3.util.retry import Retry
 from app.domain.interfaces.message_provider import IMessageProvider
 from app.config.settings import Config
 from app.utils.webhook_parser import WebhookParser
+from app.utils import fastjson
 
 
 class WhatsAppProvider(IMessageProvider):
@@ -15,12 +17,25 @@ class WhatsAppProvider(IMessageProvider):
     WhatsApp Cloud API provider implementation.
     
     Implements IMessageProvider interface following Strategy Pattern.
+    Holds a single keep-alive session for the provider's lifetime, so sends
+    reuse open TLS connections to the Graph API.
     """
     
-    def __init__(self):
-        """Initialize WhatsApp provider with connection pooling."""
+    # All requests go to graph.facebook.com, so one host pool is enough
+    POOL_MAXSIZE = 50
+    
+    # Concurrent sends per bulk call (kept well below Graph API rate limits)
+    BULK_MAX_WORKERS = 8
+    
+    def __init__(self, session: Optional[requests.Session] = None):
+        """
+        Initialize WhatsApp provider with connection pooling.
+        
+        Args:
+            session: Optional pre-configured requests session (Dependency Injection)
+        """
         self._logger = logging.getLogger(__name__)
-        self._session = self._create_session()
+        self._session = session or self._create_session()
         self._base_url = None
         self._headers = None
     
@@ -30,21 +45,25 @@ class WhatsAppProvider(IMessageProvider):
         
         retry_strategy = Retry(
             total=2,
-            backoff_factor=0.5,
+            backoff_factor=0.1,  # Retries run inside the request/task, keep them short
             status_forcelist=[429, 500, 502, 503, 504],
             allowed_methods=["POST"]
         )
         
         adapter = HTTPAdapter(
             max_retries=retry_strategy,
-            pool_connections=20,
-            pool_maxsize=20,
+            pool_connections=1,
+            pool_maxsize=self.POOL_MAXSIZE,
             pool_block=False
         )
         
         session.mount("https://", adapter)
         return session
     
+    def close(self) -> None:
+        """Close the keep-alive session and its pooled connections."""
+        self._session.close()
+    
     def _get_base_url(self) -> str:
         """Get the base URL for WhatsApp API."""
         if not self._base_url:
@@ -92,13 +111,13 @@ class WhatsAppProvider(IMessageProvider):
             
             response = self._session.post(
                 url,
-                json=payload,
+                data=fastjson.dumps(payload),
                 headers=headers,
                 timeout=8
             )
             
             if response.status_code == 200:
-                response_data = response.json()
+                response_data = fastjson.loads(response.content)
                 return {
                     "status": "success",
                     "message_id": response_data.get("messages", [{}])[0].get("id"),
@@ -108,7 +127,7 @@ class WhatsAppProvider(IMessageProvider):
                 self._log_error(response)
                 # Return error dictionary instead of None
                 try:
-                    error_data = response.json()
+                    error_data = fastjson.loads(response.content)
                     error_msg = error_data.get('error', {}).get('message', 'Unknown error')
                     error_code = error_data.get('error', {}).get('code')
                 except:
@@ -132,6 +151,26 @@ class WhatsAppProvider(IMessageProvider):
             self._logger.error(f"Unexpected error: {e}", exc_info=True)
             return None
     
+    def send_text_messages_bulk(
+        self,
+        items: List[Tuple[str, str]]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Send several text messages concurrently over the pooled session.
+        
+        Args:
+            items: (recipient, message) pairs
+            
+        Returns:
+            One ``send_text_message`` result per item, in the same order
+        """
+        if len(items) <= 1:
+            return [self.send_text_message(recipient, message) for recipient, message in items]
+        
+        workers = min(self.BULK_MAX_WORKERS, len(items))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="whatsapp-send") as executor:
+            return list(executor.map(lambda item: self.send_text_message(*item), items))
+    
     def send_typing_indicator(self, message_id: str) -> Optional[Dict[str, Any]]:
         """
         Send typing indicator for a message.
@@ -155,7 +194,7 @@ class WhatsAppProvider(IMessageProvider):
             
             response = self._session.post(
                 url,
-                json=payload,
+                data=fastjson.dumps(payload),
                 headers=headers,
                 timeout=8
             )
@@ -168,6 +207,22 @@ class WhatsAppProvider(IMessageProvider):
         except Exception:
             return None
     
+    def is_user_message(self, webhook_body: Dict[str, Any]) -> bool:
+        """
+        Check whether a webhook carries a text message, without building the parsed result.
+        
+        Args:
+            webhook_body: Raw WhatsApp webhook payload
+            
+        Returns:
+            True for text messages (the only type ``parse_webhook`` handles), False otherwise
+        """
+        try:
+            messages = webhook_body["entry"][0]["changes"][0]["value"].get("messages")
+            return bool(messages) and "body" in (messages[0].get("text") or {})
+        except (KeyError, IndexError, TypeError, AttributeError):
+            return False
+    
     def parse_webhook(self, webhook_body: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
         Parse incoming WhatsApp webhook payload.
@@ -179,21 +234,18 @@ class WhatsAppProvider(IMessageProvider):
             Parsed message data with keys: user_id, user_name, message_id, message_body
             or None if not a valid message
         """
-        if not WebhookParser.is_valid_message(webhook_body):
+        # Single pass over entry/changes/value; the fields below read the resolved nodes
+        event = WebhookParser.parse(webhook_body)
+        if event.kind != "message":
             return None
         
         try:
-            value = webhook_body["entry"][0]["changes"][0]["value"]
-            message = value["messages"][0]
+            message = event.message
             
             # Extract user info
-            try:
-                contact = value["contacts"][0]
-                user_id = contact["wa_id"]
-                user_name = contact.get("profile", {}).get("name", user_id)
-            except (KeyError, IndexError):
-                user_id = message.get("from", "unknown")
-                user_name = user_id
+            user_id = event.wa_id
+            contact = (event.value.get("contacts") or [{}])[0]
+            user_name = contact.get("profile", {}).get("name", user_id) if contact.get("wa_id") else user_id
             
             return {
                 "user_id": user_id,
@@ -209,7 +261,7 @@ class WhatsAppProvider(IMessageProvider):
     def _log_error(self, response: requests.Response) -> None:
         """Log error response details."""
         try:
-            error_data = response.json()
+            error_data = fastjson.loads(response.content)
             error_msg = error_data.get('error', {}).get('message', 'Unknown error')
             error_code = error_data.get('error', {}).get('code')
             self._logger.error(
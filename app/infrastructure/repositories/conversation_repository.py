@@ -1,11 +1,21 @@
 """Repository for managing conversation history using Redis (Repository Pattern)."""
 import logging
-import json
 from typing import Optional, List, Dict, Any
 import redis
 
 from app.domain.interfaces.conversation_repository import IConversationRepository
 from app.config.settings import Config
+from app.utils import fastjson
+
+
+# Only write the expiry when it would move later (also sets it on keys without a TTL).
+# Returns 0 if the key does not exist.
+_EXTEND_TTL_SCRIPT = """
+local t = redis.call('TTL', KEYS[1])
+if t == -2 then return 0 end
+if t < tonumber(ARGV[1]) then redis.call('EXPIRE', KEYS[1], ARGV[1]) end
+return 1
+"""
 
 
 class RedisConversationRepository(IConversationRepository):
@@ -14,7 +24,8 @@ class RedisConversationRepository(IConversationRepository):
     
     Follows Repository Pattern and Single Responsibility Principle.
     Uses Redis TTL for automatic expiration of inactive conversations (1 hour).
-    Stores messages as JSON arrays.
+    Stores each conversation as a Redis list with one JSON-encoded message per
+    element, so new messages are appended without rewriting the history.
     """
     
     def __init__(self, redis_client: Optional[redis.Redis] = None, ttl: Optional[int] = None):
@@ -29,6 +40,9 @@ class RedisConversationRepository(IConversationRepository):
         self.ttl = ttl or Config.REDIS_THREAD_TTL  # Reuse same TTL config
         self._logger = logging.getLogger(__name__)
         self._key_prefix = "conversation:"
+        self._extend_ttl_script = (
+            self.redis.register_script(_EXTEND_TTL_SCRIPT) if self.redis else None
+        )
     
     def _get_key(self, user_id: str) -> str:
         """Generate Redis key for conversation."""
@@ -50,19 +64,96 @@ class RedisConversationRepository(IConversationRepository):
         
         try:
             key = self._get_key(user_id)
-            data = self.redis.get(key)
+            try:
+                items = self.redis.lrange(key, 0, -1)
+            except redis.ResponseError:
+                # Conversation written before the list layout (single JSON array)
+                data = self.redis.get(key)
+                return fastjson.loads(data) if data else None
             
-            if data:
-                messages = json.loads(data)
+            if items:
+                messages = [fastjson.loads(item) for item in items]
                 self._logger.debug(f"Retrieved {len(messages)} messages for {user_id}")
                 return messages
             else:
                 self._logger.debug(f"No conversation found for {user_id}")
                 return None
-        except (redis.RedisError, json.JSONDecodeError) as e:
+        except (redis.RedisError, fastjson.JSONDecodeError) as e:
             self._logger.error(f"Error retrieving conversation for {user_id}: {e}")
             return None
     
+    def get_conversation_tail(self, user_id: str, n: int) -> Optional[List[Dict[str, Any]]]:
+        """
+        Retrieve the last ``n`` messages of a conversation.
+        
+        The slice is taken by Redis (``LRANGE key -n -1``), so only the
+        requested messages are transferred and decoded.
+        
+        Args:
+            user_id: User identifier
+            n: Number of most recent messages to return (must be positive)
+            
+        Returns:
+            Up to ``n`` messages in OpenAI format, or None if no conversation exists
+        """
+        if not self.redis:
+            self._logger.error("Redis client not initialized")
+            return None
+        
+        try:
+            try:
+                items = self.redis.lrange(self._get_key(user_id), -n, -1)
+            except redis.ResponseError:
+                # Legacy single-string conversation: slice after decoding it
+                messages = self.get_conversation(user_id)
+                return messages[-n:] if messages else None
+            
+            if not items:
+                return None
+            return [fastjson.loads(item) for item in items]
+        except (redis.RedisError, fastjson.JSONDecodeError) as e:
+            self._logger.error(f"Error retrieving conversation for {user_id}: {e}")
+            return None
+    
+    def get_conversations(self, user_ids: List[str]) -> Dict[str, Optional[List[Dict[str, Any]]]]:
+        """
+        Retrieve conversation histories for several users in one pipelined round trip.
+        
+        Args:
+            user_ids: User identifiers
+            
+        Returns:
+            Dictionary mapping each user ID to its messages, or None if it has no conversation
+        """
+        if not self.redis:
+            self._logger.error("Redis client not initialized")
+            return {user_id: None for user_id in user_ids}
+        
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            for user_id in user_ids:
+                pipe.lrange(self._get_key(user_id), 0, -1)
+            results = pipe.execute(raise_on_error=False)
+        except redis.RedisError as e:
+            self._logger.error(f"Error retrieving conversations for {len(user_ids)} users: {e}")
+            return {user_id: None for user_id in user_ids}
+        
+        conversations: Dict[str, Optional[List[Dict[str, Any]]]] = {}
+        for user_id, items in zip(user_ids, results):
+            if isinstance(items, redis.ResponseError):
+                # Legacy single-string conversation
+                conversations[user_id] = self.get_conversation(user_id)
+            elif isinstance(items, Exception):
+                self._logger.error(f"Error retrieving conversation for {user_id}: {items}")
+                conversations[user_id] = None
+            else:
+                try:
+                    conversations[user_id] = [fastjson.loads(item) for item in items] or None
+                except fastjson.JSONDecodeError as e:
+                    self._logger.error(f"Error decoding conversation for {user_id}: {e}")
+                    conversations[user_id] = None
+        return conversations
+    
     def save_conversation(
         self,
         user_id: str,
@@ -71,6 +162,8 @@ class RedisConversationRepository(IConversationRepository):
         """
         Store conversation history for a user.
         
+        Replaces the stored history and sets its TTL in one MULTI/EXEC round trip.
+        
         Args:
             user_id: User identifier
             messages: List of messages in OpenAI format
@@ -84,17 +177,17 @@ class RedisConversationRepository(IConversationRepository):
         
         try:
             key = self._get_key(user_id)
-            data = json.dumps(messages)
-            result = self.redis.setex(key, self.ttl, data)
-            
-            if result:
-                self._logger.info(
-                    f"Saved {len(messages)} messages for {user_id} with TTL {self.ttl}s"
-                )
-            else:
-                self._logger.warning(f"Failed to save conversation for {user_id}")
+            pipe = self.redis.pipeline(transaction=True)
+            pipe.delete(key)
+            if messages:
+                pipe.rpush(key, *[fastjson.dumps(message) for message in messages])
+                pipe.expire(key, self.ttl)
+            pipe.execute()
             
-            return result
+            self._logger.info(
+                f"Saved {len(messages)} messages for {user_id} with TTL {self.ttl}s"
+            )
+            return True
         except (redis.RedisError, (TypeError, ValueError)) as e:
             self._logger.error(f"Error storing conversation for {user_id}: {e}")
             return False
@@ -119,6 +212,42 @@ class RedisConversationRepository(IConversationRepository):
             tool_call_id: Optional tool call ID (for tool messages)
             name: Optional function name (for tool messages)
             
+        Returns:
+            True if successful, False otherwise
+        """
+        # Build message dict
+        message: Dict[str, Any] = {
+            "role": role,
+            "content": content
+        }
+        
+        if tool_calls:
+            message["tool_calls"] = tool_calls
+        
+        if tool_call_id:
+            message["tool_call_id"] = tool_call_id
+        
+        if name:
+            message["name"] = name
+        
+        return self.add_messages(user_id, [message])
+    
+    def add_messages(
+        self,
+        user_id: str,
+        messages: List[Dict[str, Any]],
+        extend_ttl: bool = True,
+        max_len: Optional[int] = None
+    ) -> bool:
+        """
+        Append several messages to the conversation history in one round trip.
+        
+        Args:
+            user_id: User identifier
+            messages: Messages in OpenAI format, in conversation order
+            extend_ttl: Whether to reset the conversation TTL
+            max_len: Optional maximum number of messages to keep (LTRIM)
+            
         Returns:
             True if successful, False otherwise
         """
@@ -126,33 +255,28 @@ class RedisConversationRepository(IConversationRepository):
             self._logger.error("Redis client not initialized")
             return False
         
+        if not messages:
+            return True
+        
         try:
-            # Get existing conversation
-            messages = self.get_conversation(user_id) or []
-            
-            # Build message dict
-            message: Dict[str, Any] = {
-                "role": role,
-                "content": content
-            }
-            
-            if tool_calls:
-                message["tool_calls"] = tool_calls
-            
-            if tool_call_id:
-                message["tool_call_id"] = tool_call_id
-            
-            if name:
-                message["name"] = name
-            
-            # Add message
-            messages.append(message)
-            
-            # Save back to Redis
-            return self.save_conversation(user_id, messages)
+            key = self._get_key(user_id)
+            pipe = self.redis.pipeline(transaction=True)
+            pipe.rpush(key, *[fastjson.dumps(message) for message in messages])
+            if max_len:
+                pipe.ltrim(key, -max_len, -1)
+            if extend_ttl:
+                pipe.expire(key, self.ttl)
+            try:
+                pipe.execute()
+            except redis.ResponseError:
+                # Legacy single-string conversation: rewrite it in the list layout
+                combined = (self.get_conversation(user_id) or []) + list(messages)
+                return self.save_conversation(user_id, combined[-max_len:] if max_len else combined)
             
+            self._logger.debug(f"Appended {len(messages)} messages for {user_id}")
+            return True
         except Exception as e:
-            self._logger.error(f"Error adding message for {user_id}: {e}")
+            self._logger.error(f"Error adding messages for {user_id}: {e}")
             return False
     
     def delete_conversation(self, user_id: str) -> bool:
@@ -183,10 +307,36 @@ class RedisConversationRepository(IConversationRepository):
             self._logger.error(f"Error deleting conversation for {user_id}: {e}")
             return False
     
+    def delete_conversations(self, user_ids: List[str]) -> int:
+        """
+        Delete the conversations of several users with a single UNLINK.
+        
+        UNLINK reclaims the memory in a background thread, so purging long
+        histories does not block Redis the way DEL does.
+        
+        Args:
+            user_ids: User identifiers
+            
+        Returns:
+            Number of conversations deleted
+        """
+        if not self.redis or not user_ids:
+            return 0
+        
+        try:
+            deleted = self.redis.unlink(*[self._get_key(user_id) for user_id in user_ids])
+            self._logger.info(f"Deleted {deleted} conversations")
+            return deleted
+        except redis.RedisError as e:
+            self._logger.error(f"Error deleting {len(user_ids)} conversations: {e}")
+            return 0
+    
     def extend_ttl(self, user_id: str) -> bool:
         """
         Extend TTL for an existing conversation (reset expiration timer).
         
+        The expiry is only rewritten when it would actually increase.
+        
         Args:
             user_id: User identifier
             
@@ -198,16 +348,56 @@ class RedisConversationRepository(IConversationRepository):
         
         try:
             key = self._get_key(user_id)
-            return bool(self.redis.expire(key, self.ttl))
+            return bool(self._extend_ttl_script(keys=[key], args=[self.ttl]))
         except redis.RedisError as e:
             self._logger.error(f"Error extending TTL for {user_id}: {e}")
             return False
     
+    def get_conversation_and_touch(
+        self,
+        user_id: str,
+        last_n: Optional[int] = None
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Retrieve conversation history and reset its TTL in one round trip.
+        
+        Args:
+            user_id: User identifier
+            last_n: Optional number of most recent messages to return
+            
+        Returns:
+            List of messages in OpenAI format, or None if no conversation exists
+        """
+        if not self.redis:
+            self._logger.error("Redis client not initialized")
+            return None
+        
+        try:
+            key = self._get_key(user_id)
+            pipe = self.redis.pipeline(transaction=True)
+            pipe.lrange(key, -last_n if last_n else 0, -1)
+            pipe.expire(key, self.ttl)
+            try:
+                items, _ = pipe.execute()
+            except redis.ResponseError:
+                # Legacy single-string conversation (EXPIRE already ran)
+                if last_n:
+                    return self.get_conversation_tail(user_id, last_n)
+                return self.get_conversation(user_id)
+            
+            if not items:
+                return None
+            return [fastjson.loads(item) for item in items]
+        except (redis.RedisError, fastjson.JSONDecodeError) as e:
+            self._logger.error(f"Error retrieving conversation for {user_id}: {e}")
+            return None
+    
     def clear_old_messages(self, user_id: str, keep_last_n: int = 20) -> bool:
         """
         Clear old messages, keeping only the last N messages.
         
-        Useful for managing context window size.
+        Deprecated: pass ``max_len`` to ``add_messages`` instead, which trims
+        the list with LTRIM in the same round trip as the append.
         
         Args:
             user_id: User identifier
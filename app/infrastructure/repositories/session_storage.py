@@ -1,12 +1,12 @@
 """Redis-based session storage implementation."""
 import logging
-import json
 from typing import Optional, Dict, Any
 import redis
 
 from app.domain.interfaces.session_storage import ISessionStorage
 from app.config.settings import Config
 from app.infrastructure.redis_client import RedisClientFactory
+from app.utils import fastjson
 
 
 class RedisSessionStorage(ISessionStorage):
@@ -42,18 +42,55 @@ class RedisSessionStorage(ISessionStorage):
         
         try:
             key = self._get_key(session_id)
-            data = self.redis.get(key)
+            try:
+                fields = self.redis.hgetall(key)
+            except redis.ResponseError:
+                # Session written before the hash layout (single JSON string)
+                data = self.redis.get(key)
+                return fastjson.loads(data) if data is not None else None
             
-            if data is None:
+            if not fields:
                 return None
             
-            return json.loads(data)
+            return {field: fastjson.loads(value) for field, value in fields.items()}
         except Exception as e:
             self._logger.error(f"Failed to get session {session_id}: {e}")
             return None
     
+    def get_session_fields(self, session_id: str, *fields: str) -> Optional[Dict[str, Any]]:
+        """Retrieve selected session fields from Redis with a single HMGET."""
+        if not self.redis:
+            self._logger.warning("Redis not available - cannot retrieve session")
+            return None
+        
+        try:
+            key = self._get_key(session_id)
+            try:
+                values = self.redis.hmget(key, fields)
+            except redis.ResponseError:
+                # Legacy single-string session: load it whole and pick the fields
+                session = self.get_session(session_id)
+                return {field: session.get(field) for field in fields} if session else None
+            
+            if all(value is None for value in values):
+                return None
+            
+            return {
+                field: fastjson.loads(value) if value is not None else None
+                for field, value in zip(fields, values)
+            }
+        except Exception as e:
+            self._logger.error(f"Failed to get session fields {session_id}: {e}")
+            return None
+    
     def set_session(self, session_id: str, data: Dict[str, Any], ttl: Optional[int] = None) -> None:
-        """Store session data in Redis."""
+        """
+        Store session data in Redis.
+        
+        Each top-level field is stored JSON-encoded in a Redis hash, so readers
+        can fetch only the fields they need. The old session is replaced and the
+        TTL set in a single MULTI/EXEC round trip.
+        """
         if not self.redis:
             self._logger.warning("Redis not available - cannot store session")
             raise RuntimeError("Redis not available - cannot store session")
@@ -62,8 +99,12 @@ class RedisSessionStorage(ISessionStorage):
             key = self._get_key(session_id)
             ttl = ttl or self.default_ttl
             
-            serialized = json.dumps(data)
-            self.redis.setex(key, ttl, serialized)
+            pipe = self.redis.pipeline(transaction=True)
+            pipe.delete(key)
+            if data:
+                pipe.hset(key, mapping={field: fastjson.dumps(value) for field, value in data.items()})
+                pipe.expire(key, ttl)
+            pipe.execute()
             self._logger.debug(f"Session {session_id} stored with TTL {ttl}s")
         except Exception as e:
             self._logger.error(f"Failed to set session {session_id}: {e}")
@@ -90,19 +131,22 @@ class RedisSessionStorage(ISessionStorage):
             raise RuntimeError("Redis not available - cannot update session")
         
         try:
-            current = self.get_session(session_id)
-            if current is None:
+            key = self._get_key(session_id)
+            key_type = self.redis.type(key)
+            if key_type == "none":
                 raise ValueError(f"Session {session_id} not found")
             
-            current.update(updates)
-            # Get current TTL to preserve it
-            key = self._get_key(session_id)
-            ttl = self.redis.ttl(key)
-            if ttl > 0:
-                self.set_session(session_id, current, ttl=ttl)
-            else:
-                self.set_session(session_id, current)
+            if key_type != "hash":
+                # Legacy single-string session: rewrite it in the hash layout
+                current = self.get_session(session_id)
+                current.update(updates)
+                ttl = self.redis.ttl(key)
+                self.set_session(session_id, current, ttl=ttl if ttl > 0 else None)
+                return
+            
+            # HSET only touches the given fields and keeps the key's TTL
+            if updates:
+                self.redis.hset(key, mapping={field: fastjson.dumps(value) for field, value in updates.items()})
         except Exception as e:
             self._logger.error(f"Failed to update session {session_id}: {e}")
             raise
-
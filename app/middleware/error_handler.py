@@ -13,25 +13,9 @@ def init_error_handlers(app) -> None:
     Args:
         app: Flask application instance
     """
-    # Initialize Sentry if DSN is provided
+    # Initialize Sentry only if DSN is provided (sentry_sdk is not imported otherwise)
     if Config.SENTRY_DSN:
-        try:
-            import sentry_sdk
-            from sentry_sdk.integrations.flask import FlaskIntegration
-            from sentry_sdk.integrations.celery import CeleryIntegration
-            
-            sentry_sdk.init(
-                dsn=Config.SENTRY_DSN,
-                integrations=[
-                    FlaskIntegration(),
-                    CeleryIntegration(),
-                ],
-                traces_sample_rate=0.1,
-                environment=app.config.get("FLASK_ENV", "production"),
-            )
-            logger.info("Sentry error tracking initialized")
-        except ImportError:
-            logger.warning("Sentry SDK not installed, skipping Sentry initialization")
+        _init_sentry(app)
     
     @app.errorhandler(404)
     def not_found(error):
@@ -61,3 +45,33 @@ def init_error_handlers(app) -> None:
             "message": "An unexpected error occurred"
         }), 500
 
+
+def _init_sentry(app) -> None:
+    """
+    Initialize Sentry error tracking.
+    
+    Only the Flask and Celery integrations are enabled explicitly; automatic
+    integration discovery is disabled so startup doesn't probe every
+    supported library.
+    
+    Args:
+        app: Flask application instance
+    """
+    try:
+        import sentry_sdk
+        from sentry_sdk.integrations.flask import FlaskIntegration
+        from sentry_sdk.integrations.celery import CeleryIntegration
+        
+        sentry_sdk.init(
+            dsn=Config.SENTRY_DSN,
+            integrations=[
+                FlaskIntegration(),
+                CeleryIntegration(),
+            ],
+            auto_enabling_integrations=False,
+            traces_sample_rate=0.1,
+            environment=app.config.get("FLASK_ENV", "production"),
+        )
+        logger.info("Sentry error tracking initialized")
+    except ImportError:
+        logger.warning("Sentry SDK not installed, skipping Sentry initialization")
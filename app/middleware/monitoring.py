@@ -1,15 +1,18 @@
 """Monitoring and metrics middleware using Prometheus."""
 import logging
-from typing import Callable
+import time
+from typing import Callable, Iterable
 from flask import request, g
-from prometheus_client import Counter, Histogram, Gauge, generate_latest, CONTENT_TYPE_LATEST
+from prometheus_client import Counter, Histogram, Gauge
 from prometheus_client import make_wsgi_app
-from werkzeug.middleware.dispatcher import DispatcherMiddleware
 
 from app.config.settings import Config
 
 logger = logging.getLogger(__name__)
 
+# Config is read once at import; metric helpers run on every message
+_METRICS_ENABLED = Config.ENABLE_METRICS
+
 # Prometheus metrics
 messages_received_total = Counter(
     'whatsapp_messages_received_total',
@@ -47,6 +50,59 @@ webhook_request_duration = Histogram(
 )
 
 
+class MetricsWSGIMiddleware:
+    """
+    Plain WSGI middleware for Prometheus metrics.
+    
+    Serves ``/metrics`` and records request count/duration for tracked paths
+    directly at the WSGI layer, without pushing a Flask request context.
+    """
+    
+    METRICS_PATH = "/metrics"
+    
+    def __init__(self, wsgi_app: Callable, tracked_paths: Iterable[str] = ("/webhook",)):
+        """
+        Initialize middleware.
+        
+        Args:
+            wsgi_app: Wrapped WSGI application
+            tracked_paths: Exact request paths to record webhook metrics for
+        """
+        self.wsgi_app = wsgi_app
+        self.metrics_app = make_wsgi_app()
+        self.tracked_paths = frozenset(tracked_paths)
+    
+    def __call__(self, environ, start_response):
+        """Dispatch request, timing it if the path is tracked."""
+        path = environ.get("PATH_INFO", "")
+        
+        if path == self.METRICS_PATH:
+            return self.metrics_app(environ, start_response)
+        
+        if path not in self.tracked_paths:
+            return self.wsgi_app(environ, start_response)
+        
+        status_holder = []
+        
+        def _start_response(status, headers, exc_info=None):
+            status_holder.append(status)
+            return start_response(status, headers, exc_info)
+        
+        start_time = time.perf_counter()
+        try:
+            return self.wsgi_app(environ, _start_response)
+        finally:
+            webhook_request_duration.labels(endpoint=path).observe(
+                time.perf_counter() - start_time
+            )
+            status_code = status_holder[0].split(" ", 1)[0] if status_holder else "500"
+            webhook_requests_total.labels(
+                method=environ.get("REQUEST_METHOD", ""),
+                endpoint=path,
+                status=status_code
+            ).inc()
+
+
 def register_metrics_middleware(app) -> None:
     """
     Register Prometheus metrics middleware.
@@ -57,16 +113,8 @@ def register_metrics_middleware(app) -> None:
     if not Config.ENABLE_METRICS:
         return
     
-    # Add metrics endpoint
-    @app.route('/metrics')
-    def metrics():
-        """Prometheus metrics endpoint."""
-        return generate_latest(), 200, {'Content-Type': CONTENT_TYPE_LATEST}
-    
-    # Wrap app with Prometheus WSGI middleware
-    app.wsgi_app = DispatcherMiddleware(app.wsgi_app, {
-        '/metrics': make_wsgi_app()
-    })
+    # Wrap app with WSGI middleware (serves /metrics and tracks webhook requests)
+    app.wsgi_app = MetricsWSGIMiddleware(app.wsgi_app)
     
     logger.info("Prometheus metrics enabled at /metrics")
 
@@ -121,7 +169,7 @@ def track_message_processing(wa_id: str, success: bool):
         success: Whether processing was successful
     """
     try:
-        if Config.ENABLE_METRICS:
+        if _METRICS_ENABLED:
             status = "success" if success else "error"
             messages_received_total.labels(status=status).inc()
     except Exception as e:
@@ -138,7 +186,7 @@ def track_openai_call(operation: str, success: bool):
         success: Whether call was successful
     """
     try:
-        if Config.ENABLE_METRICS:
+        if _METRICS_ENABLED:
             status = "success" if success else "error"
             openai_api_calls_total.labels(operation=operation, status=status).inc()
     except Exception as e:
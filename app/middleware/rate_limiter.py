@@ -7,6 +7,7 @@ from typing import Callable
 
 from app.config.settings import Config
 from app.infrastructure.redis_client import RedisClientFactory
+from app.utils.webhook_parser import WebhookParser
 
 
 def get_limiter_key() -> str:
@@ -18,12 +19,12 @@ def get_limiter_key() -> str:
     """
     # Try to extract WhatsApp user ID from request body
     if request.is_json:
-        body = request.get_json()
+        body = request.get_json(silent=True)
         try:
-            wa_id = body.get("entry", [{}])[0].get("changes", [{}])[0].get("value", {}).get("contacts", [{}])[0].get("wa_id")
-            if wa_id:
-                return f"rate_limit:wa:{wa_id}"
-        except (KeyError, IndexError, AttributeError):
+            event = WebhookParser.parse(body)
+            if event.kind == "message" and event.wa_id != "unknown":
+                return f"rate_limit:wa:{event.wa_id}"
+        except (KeyError, IndexError, AttributeError, TypeError):
             pass
     
     # Fallback to IP address
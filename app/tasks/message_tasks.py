@@ -1,11 +1,13 @@
 """Celery tasks for processing messages asynchronously."""
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Union
 from celery import Task
 from app.infrastructure.celery_app import celery_app
 from app.infrastructure.adapters.message_handler import MessageHandler
-from app.infrastructure.di.service_container import ServiceContainer
+from app.infrastructure.di.service_container import get_service_container
 from app.middleware.monitoring import track_message_processing, track_openai_call
+from app.utils import fastjson
+from app.utils.webhook_parser import WebhookParser
 
 
 logger = logging.getLogger(__name__)
@@ -30,7 +32,7 @@ class CallbackTask(Task):
     default_retry_delay=60,
     name="message_bot.process_message"
 )
-def process_message_task(self, webhook_body: Dict[str, Any]) -> Dict[str, Any]:
+def process_message_task(self, webhook_body: Union[str, Dict[str, Any]]) -> Dict[str, Any]:
     """
     Process message asynchronously via configured provider.
     
@@ -38,33 +40,24 @@ def process_message_task(self, webhook_body: Dict[str, Any]) -> Dict[str, Any]:
     
     Args:
         self: Task instance (bound task)
-        webhook_body: Provider webhook payload
+        webhook_body: Provider webhook payload, either the raw JSON request
+            body or an already decoded dict
         
     Returns:
         Processing result dictionary
     """
+    # The webhook enqueues the raw body so the payload is only decoded here
+    if isinstance(webhook_body, str):
+        webhook_body = fastjson.loads(webhook_body)
+    
+    # User id for logging and metrics, resolved in a single pass over the payload
+    user_id = WebhookParser.parse(webhook_body).wa_id
+    
     try:
-        # Extract user_id for logging (provider-agnostic)
-        user_id = "unknown"
-        try:
-            # Try to get user_id from parsed message
-            container = ServiceContainer()
-            message_provider = container.get_message_provider()
-            parsed = message_provider.parse_webhook(webhook_body)
-            if parsed:
-                user_id = parsed.get("user_id", "unknown")
-        except (KeyError, IndexError, Exception):
-            # Fallback: try to extract from webhook structure
-            try:
-                user_id = webhook_body["entry"][0]["changes"][0]["value"].get("contacts", [{}])[0].get("wa_id") or \
-                          webhook_body["entry"][0]["changes"][0]["value"].get("messages", [{}])[0].get("from", "unknown")
-            except (KeyError, IndexError):
-                user_id = "unknown"
-        
         logger.info(f"Processing message for {user_id}")
         
         # Get service container and process message
-        container = ServiceContainer()
+        container = get_service_container()
         message_handler = container.get_message_handler()
         message_handler.process_incoming_message(webhook_body)
         
@@ -78,16 +71,6 @@ def process_message_task(self, webhook_body: Dict[str, Any]) -> Dict[str, Any]:
         logger.error(f"Task failed: {exc}", exc_info=True)
         
         # Track failure
-        try:
-            container = ServiceContainer()
-            message_provider = container.get_message_provider()
-            parsed = message_provider.parse_webhook(webhook_body)
-            if parsed:
-                user_id = parsed.get("user_id", "unknown")
-            else:
-                user_id = "unknown"
-        except Exception:
-            user_id = "unknown"
         track_message_processing(user_id, False)
         
         # Retry with exponential backoff
@@ -0,0 +1,88 @@
+"""Fast JSON encoding/decoding helpers.
+
+Uses orjson when it is installed and falls back to the stdlib json module
+otherwise, so callers never need to care which backend is active.
+"""
+import json
+from typing import Any, Union
+
+from flask import Response
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # orjson is optional - stdlib json is used instead
+    orjson = None
+
+
+if orjson is not None:
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError (and ValueError)
+    JSONDecodeError = orjson.JSONDecodeError
+
+    def loads(data: Union[bytes, bytearray, str]) -> Any:
+        """Deserialize JSON bytes or str."""
+        return orjson.loads(data)
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize object to compact UTF-8 JSON bytes."""
+        return orjson.dumps(obj)
+
+    def dumps_pretty(obj: Any) -> str:
+        """Serialize object to indented JSON text (non-JSON values via ``str``)."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=str).decode("utf-8")
+else:
+    JSONDecodeError = json.JSONDecodeError
+
+    def loads(data: Union[bytes, bytearray, str]) -> Any:
+        """Deserialize JSON bytes or str."""
+        return json.loads(data)
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize object to compact UTF-8 JSON bytes."""
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+    def dumps_pretty(obj: Any) -> str:
+        """Serialize object to indented JSON text (non-JSON values via ``str``)."""
+        return json.dumps(obj, indent=2, default=str, ensure_ascii=False)
+
+
+def json_response(body: bytes, status: int = 200) -> Response:
+    """
+    Build a JSON response from an already serialized body.
+    
+    Args:
+        body: UTF-8 JSON bytes (e.g. a constant pre-serialized at import time)
+        status: HTTP status code
+        
+    Returns:
+        Flask Response with an ``application/json`` body
+    """
+    return Response(body, status=status, mimetype="application/json")
+
+
+def ojsonify(obj: Any, status: int = 200) -> Response:
+    """
+    Build a JSON response without going through ``flask.jsonify``.
+    
+    Args:
+        obj: JSON-serializable payload
+        status: HTTP status code
+        
+    Returns:
+        Flask Response with an ``application/json`` body
+    """
+    return json_response(dumps(obj), status)
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider that decodes request bodies with :func:`loads`.
+    
+    Installed as ``app.json`` so ``request.get_json()`` uses orjson when it
+    is available. Encoding is left to the default provider, which honours
+    Flask's ``sort_keys``/``indent`` settings for ``jsonify``.
+    """
+    
+    def loads(self, s: Union[str, bytes], **kwargs: Any) -> Any:
+        """Deserialize JSON request data."""
+        return loads(s)
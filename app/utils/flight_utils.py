@@ -14,6 +14,9 @@ except ImportError:
     dateutil_parse = None
     logger.warning("python-dateutil not installed, relative date parsing will be limited")
 
+# OpenAI client for airport code extraction (created on first use)
+_openai_client = None
+
 
 def format_date(date_string: Optional[str]) -> Optional[str]:
     """
@@ -102,15 +105,18 @@ def extract_airport_code_with_llm(city_name: str) -> Optional[str]:
     Returns:
         3-character airport code or None if extraction fails
     """
+    global _openai_client
     try:
-        from openai import OpenAI
         from app.config.settings import Config
         
-        if not Config.OPENAI_API_KEY:
-            logger.warning("OpenAI API key not configured, cannot use LLM for airport code extraction")
-            return None
-        
-        client = OpenAI(api_key=Config.OPENAI_API_KEY)
+        if _openai_client is None:
+            if not Config.OPENAI_API_KEY:
+                logger.warning("OpenAI API key not configured, cannot use LLM for airport code extraction")
+                return None
+            
+            from openai import OpenAI
+            _openai_client = OpenAI(api_key=Config.OPENAI_API_KEY)
+        client = _openai_client
         
         prompt = f"""Extract the IATA airport code (3 letters) for the following city or location.
 If the input is already a 3-letter code, return it as-is.
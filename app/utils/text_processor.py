@@ -23,11 +23,13 @@ class WhatsAppTextProcessor:
         Returns:
             Processed text formatted for WhatsApp
         """
-        # Remove brackets
-        processed = cls.BRACKET_PATTERN.sub("", text).strip()
+        # Remove brackets (substring checks skip the regex scan when there is nothing to replace)
+        processed = cls.BRACKET_PATTERN.sub("", text) if "【" in text else text
+        processed = processed.strip()
         
         # Convert **bold** to *bold* (WhatsApp format)
-        processed = cls.BOLD_PATTERN.sub(r"*\1*", processed)
+        if "**" in processed:
+            processed = cls.BOLD_PATTERN.sub(r"*\1*", processed)
         
         return processed
 
@@ -1,10 +1,58 @@
 """Utilities for parsing WhatsApp webhook payloads."""
-from typing import Dict, Any, Optional, List
+from dataclasses import dataclass, field
+from typing import Dict, Any, Optional, List, Literal
+
+
+@dataclass(slots=True)
+class ParsedEvent:
+    """Result of classifying a webhook payload in a single pass."""
+    kind: Literal["status", "message", "invalid"]
+    wa_id: str = "unknown"
+    statuses: List[Dict[str, Any]] = field(default_factory=list)
+    message: Optional[Dict[str, Any]] = None
+    value: Dict[str, Any] = field(default_factory=dict)  # resolved entry[0].changes[0].value
 
 
 class WebhookParser:
     """Utility class for parsing WhatsApp webhook payloads."""
     
+    @staticmethod
+    def parse(webhook_body: Dict[str, Any]) -> ParsedEvent:
+        """
+        Classify a webhook payload, walking the nested structure only once.
+        
+        Args:
+            webhook_body: Webhook payload
+            
+        Returns:
+            ParsedEvent with kind "status", "message" or "invalid"
+        """
+        if not isinstance(webhook_body, dict):
+            return ParsedEvent(kind="invalid")
+        
+        # Explicit .get() traversal: missing keys are the common case for
+        # non-message payloads and never raise; the except only catches
+        # valid JSON with an unexpected shape (e.g. "entry" not a list of dicts)
+        try:
+            entry = (webhook_body.get("entry") or [{}])[0]
+            change = (entry.get("changes") or [{}])[0]
+            value = change.get("value") or {}
+            
+            statuses = value.get("statuses")
+            if statuses:
+                return ParsedEvent(kind="status", statuses=statuses, value=value)
+            
+            messages = value.get("messages")
+            if not (webhook_body.get("object") and messages and messages[0]):
+                return ParsedEvent(kind="invalid")
+            
+            message = messages[0]
+            contact = (value.get("contacts") or [{}])[0]
+            wa_id = contact.get("wa_id") or message.get("from", "unknown")
+            return ParsedEvent(kind="message", wa_id=wa_id, message=message, value=value)
+        except (IndexError, KeyError, AttributeError, TypeError):
+            return ParsedEvent(kind="invalid")
+    
     @staticmethod
     def is_status_update(webhook_body: Dict[str, Any]) -> bool:
         """
@@ -25,8 +25,14 @@ else:
     else:
         workers = min(cpu_count, 8)  # Cap at 8 for dedicated servers
 
-worker_class = "sync"
-worker_connections = 1000
+# Threaded workers: a request blocked on an outbound provider call (e.g.
+# /api/send-message waiting on the WhatsApp API) only ties up one thread,
+# not the whole worker process
+# GUNICORN_WORKER_CLASS=gevent (requires the gevent package) multiplexes
+# outbound I/O on greenlets instead; worker_connections caps greenlets per worker
+worker_class = os.getenv("GUNICORN_WORKER_CLASS", "gthread")
+threads = int(os.getenv("GUNICORN_THREADS", "8"))
+worker_connections = int(os.getenv("GUNICORN_WORKER_CONNECTIONS", "1000"))
 timeout = 120  # Increased for Railway - some requests may take longer
 keepalive = 5
 graceful_timeout = 30  # Time to wait for workers to finish before killing them
@@ -59,7 +65,10 @@ tmp_upload_dir = None
 
 # Preload app to ensure it's ready immediately when workers start
 # This helps Railway's health checks pass faster
-preload_app = True
+# Async workers (gevent/eventlet) monkey-patch the stdlib when each worker
+# boots; the app (requests, redis, ssl) must be imported after that, so it
+# is not preloaded in the master for those worker classes
+preload_app = worker_class not in ("gevent", "eventlet")
 
 # SSL (if needed)
 # keyfile = "/path/to/keyfile"